@@ -1,15 +1,17 @@
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pandas as pd
-from typing import List, Dict
-import numpy as np
-
-from src.utils.pdf_loader import parse_pdf
-from src.llm.llm_config import get_llm
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from src.utils.pdf_loader import extract_pdf_text
+from src.llm.llm_config import get_router
 from src.resume_analyzer import ResumeAnalysisSystem
-from src.utils.chart_builder import create_radar_chart, create_bar_charts
+
+# Number of resumes parsed and analyzed at the same time
+MAX_WORKERS = 4
+# How often the progress table is refreshed while resumes are processed (seconds)
+PROGRESS_REFRESH_SECONDS = 0.5
 
 # Initialize session state variables if they don't exist
 if "job_description" not in st.session_state:
@@ -72,8 +74,11 @@ st.markdown(
 
 @st.cache_resource
 def get_resume_system():
-    llm = get_llm()
+    llm = get_router()
     resume_system = ResumeAnalysisSystem(llm)
+    # Precompile the stage chains and open the provider connections before the first
+    # upload instead of during it
+    resume_system.warm_up()
     return resume_system
 
 
@@ -96,6 +101,81 @@ def clear_session_state():
         del st.session_state[key]
 
 
+def process_uploads(uploaded_files, job_description):
+    """
+    Parses and analyzes the uploaded resumes on a bounded pool of worker threads while
+    the script thread renders a live per-file progress table with partial results.
+
+    Returns:
+        One entry per uploaded file, in upload order: the analysis result, or the
+        exception raised while processing that file.
+    """
+    statuses = {idx: "⏳ Queued" for idx in range(len(uploaded_files))}
+    pages = {}
+    scores = {}
+    ctx = get_script_run_ctx()
+
+    def attach_script_context():
+        # Lets the cached analysis function run from the worker threads
+        add_script_run_ctx(threading.current_thread(), ctx)
+
+    def process(idx, file):
+        statuses[idx] = "📄 Parsing"
+        pdf = extract_pdf_text(file)
+        pages[idx] = f"{pdf.pages_read}/{pdf.total_pages}"
+        if pdf.truncated:
+            pages[idx] += " ✂️ truncated"
+        statuses[idx] = "🔄 Analyzing"
+        return analyze_resume(pdf.text, job_description)
+
+    progress_table = st.empty()
+
+    def render_progress():
+        progress_table.table(
+            [
+                {
+                    "File": file.name,
+                    "Status": statuses[idx],
+                    "Pages": pages.get(idx, ""),
+                    "Candidate": scores.get(idx, ("", ""))[0],
+                    "Score": scores.get(idx, ("", ""))[1],
+                }
+                for idx, file in enumerate(uploaded_files)
+            ]
+        )
+
+    outcomes = [None] * len(uploaded_files)
+    with ThreadPoolExecutor(
+        max_workers=MAX_WORKERS, initializer=attach_script_context
+    ) as executor:
+        futures = {
+            executor.submit(process, idx, file): idx
+            for idx, file in enumerate(uploaded_files)
+        }
+        pending = set(futures)
+        while pending:
+            render_progress()
+            done, pending = wait(
+                pending, timeout=PROGRESS_REFRESH_SECONDS, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                idx = futures[future]
+                try:
+                    outcomes[idx] = future.result()
+                except Exception as exc:
+                    outcomes[idx] = exc
+                    statuses[idx] = "❌ Failed"
+                else:
+                    statuses[idx] = "✅ Done"
+                    scores[idx] = (
+                        outcomes[idx]["name"],
+                        f"{outcomes[idx]['total_score']:.1f}",
+                    )
+        render_progress()
+
+    return outcomes
+
+
 @st.cache_data()
 def adjusted_score(component, score):
     weights = {"skills": 0.4, "experience": 0.3, "education": 0.2, "other": 0.1}
@@ -138,26 +218,28 @@ def main():
             # Store job description in session state
             st.session_state.job_description = job_description
 
-            # Parse resumes and analyze
+            # Parse and analyze the resumes concurrently
+            outcomes = process_uploads(uploaded_files, job_description)
+
             results = []
-            for idx, file in enumerate(uploaded_files):
-                with st.status(f"📄 Processing {file.name}..."):
-                    resume_text = parse_pdf(file)
-                    result = analyze_resume(resume_text, job_description)
-
-                    result_summary = {
-                        # "name": file.name.replace(".pdf", ""),
-                        "name": result["name"],
-                        "total_score": result["total_score"],
-                        "skills": result["component_scores"]["skills"]["score"],
-                        "experience": result["component_scores"]["experience"]["score"],
-                        "education": result["component_scores"]["education"]["score"],
-                        "other": result["component_scores"]["other"]["score"],
-                    }
-                    results.append(result_summary)
-
-                    # Store full result in session state
-                    st.session_state[f"full_result_{idx}"] = result
+            for file, outcome in zip(uploaded_files, outcomes):
+                if isinstance(outcome, Exception):
+                    st.error(f"⚠️ Could not analyze {file.name}: {outcome}")
+                    continue
+
+                result_summary = {
+                    # "name": file.name.replace(".pdf", ""),
+                    "name": outcome["name"],
+                    "total_score": outcome["total_score"],
+                    "skills": outcome["component_scores"]["skills"]["score"],
+                    "experience": outcome["component_scores"]["experience"]["score"],
+                    "education": outcome["component_scores"]["education"]["score"],
+                    "other": outcome["component_scores"]["other"]["score"],
+                }
+
+                # Store full result in session state
+                st.session_state[f"full_result_{len(results)}"] = outcome
+                results.append(result_summary)
 
             # Store results in session state
             st.session_state.results = results
@@ -165,6 +247,9 @@ def main():
 
     # Display results if analysis is complete (either from this run or previous)
     if st.session_state.analysis_complete and st.session_state.results:
+        # Charting pulls in plotly and pandas, so load it only once there is something to draw
+        from src.utils.chart_builder import create_radar_chart, create_bar_charts
+
         st.success("✅ Analysis Completed!")
 
         st.markdown("### 📊 Analysis Results")
@@ -0,0 +1,89 @@
+"""
+Measures the per-call overhead of building a stage chain on every call compared with
+reusing the precompiled chain from the system's registry.
+
+Chain construction is timed for the local stand-in model and for a
+ChatGoogleGenerativeAI client (constructed offline, no request is sent); per-call
+latency is measured through the invoker with a zero-latency stand-in.
+
+Run from the repository root:
+
+    python -m benchmarks.chain_overhead --calls 2000 --concurrency 16
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.tail_latency import percentile
+from src.llm.llm_config import SKILLS_SCORE, get_llm
+from src.llm.stand_in import StandInLLM
+from src.resume_analyzer import STAGE_SPECS, ResumeAnalysisSystem
+
+INPUTS = {
+    "resume_skills": ["Python", "SQL", "Docker"],
+    "required_skills": ["Python", "Kubernetes"],
+}
+
+
+def rebuilt(system):
+    structured_class, prompt_template = STAGE_SPECS[SKILLS_SCORE]
+    return system.get_structured_llm_chain(
+        structured_class, prompt_template, SKILLS_SCORE
+    )
+
+
+def precompiled(system):
+    return system.stage_chain(SKILLS_SCORE)
+
+
+def time_builds(system, get_chain, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        get_chain(system)
+    return (time.perf_counter() - start) / calls
+
+
+def time_calls(system, get_chain, calls, concurrency):
+    def one(_):
+        start = time.perf_counter()
+        system.invoker.invoke(SKILLS_SCORE, get_chain(system), INPUTS)
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(one, range(calls)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    clients = {
+        "stand-in": StandInLLM(),
+        "gemini": get_llm(google_api_key="benchmark"),
+    }
+    print("chain construction per call")
+    for name, llm in clients.items():
+        system = ResumeAnalysisSystem(llm)
+        for label, get_chain in (("rebuilt", rebuilt), ("registry", precompiled)):
+            per_call = time_builds(system, get_chain, min(args.calls, 500))
+            print(f"{name:>10} {label:>9}: {per_call * 1e6:8.1f}us")
+
+    print()
+    print(f"invoke latency, {args.calls} calls at concurrency {args.concurrency}")
+    system = ResumeAnalysisSystem(StandInLLM(), score_cache_size=0)
+    system.warm_up()
+    for label, get_chain in (("rebuilt", rebuilt), ("registry", precompiled)):
+        timings = time_calls(system, get_chain, args.calls, args.concurrency)
+        print(
+            f"{label:>10}: mean={statistics.mean(timings) * 1e3:.2f}ms "
+            f"p50={percentile(timings, 50) * 1e3:.2f}ms "
+            f"p99={percentile(timings, 99) * 1e3:.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
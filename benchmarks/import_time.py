@@ -0,0 +1,91 @@
+"""
+Measures cold-start import time of the library modules with `python -X importtime` and
+enforces a budget. Exits with status 1 when a module exceeds its budget or pulls in a
+module it must not load.
+
+Run from the repository root:
+
+    python -m benchmarks.import_time
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Cumulative import time budget per module, in milliseconds. Most of
+# src.resume_analyzer is langchain_core (best runs measured 690-840ms), so its budget
+# only catches large regressions; the forbidden modules below are the strict check.
+IMPORT_BUDGETS_MS = {
+    "src.resume_analyzer": 1200,
+    "src.llm.llm_config": 50,
+    "src.utils.pdf_loader": 20,
+}
+
+# Modules that must stay unloaded when importing the library path
+FORBIDDEN_MODULES = (
+    "streamlit",
+    "plotly",
+    "pandas",
+    "numpy",
+    "matplotlib",
+    "langchain_google_genai",
+    "pypdf",
+)
+
+
+def measure(module: str):
+    """
+    Imports `module` in a fresh interpreter.
+
+    Returns:
+        A tuple of the cumulative import time in milliseconds and the set of top-level
+        packages imported along the way.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative_us = None
+    loaded = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        loaded.add(name.split(".")[0])
+        if name == module and cumulative.strip().isdigit():
+            cumulative_us = int(cumulative)
+
+    return (cumulative_us or 0) / 1000, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Runs per module, the best is kept"
+    )
+    args = parser.parse_args()
+
+    failures = []
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        # The first run also writes bytecode caches, taking the best run filters that out
+        results = [measure(module) for _ in range(args.runs)]
+        best = min(elapsed for elapsed, _ in results)
+        loaded = results[-1][1]
+
+        forbidden = sorted(loaded.intersection(FORBIDDEN_MODULES))
+        status = "ok" if best <= budget and not forbidden else "FAIL"
+        print(f"{status:>4} {module}: {best:.1f}ms (budget {budget}ms)")
+        if forbidden:
+            print(f"     loads forbidden modules: {', '.join(forbidden)}")
+        if status == "FAIL":
+            failures.append(module)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Drives `analyze_multiple_resumes` against a local mock Gemini server for a sustained
+period through the real `ChatGoogleGenerativeAI` client, and reports throughput, error
+rates and memory growth.
+
+Run from the repository root:
+
+    python -m benchmarks.load_test --duration 300 --workers 8 --rate-429 0.02
+"""
+
+import argparse
+import resource
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+from benchmarks.mock_gemini_server import MockGeminiConfig, MockGeminiServer
+from src.llm.llm_config import get_invoker, get_llm
+from src.resume_analyzer import ResumeAnalysisSystem
+
+
+def max_rss_mb():
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def worker(system, job_description, batch_size, stop, stats, failures, lock):
+    batch = 0
+    while not stop.is_set():
+        batch += 1
+        # Distinct resume texts so repeated batches do not hit in-process caches
+        resumes = [
+            f"resume {threading.get_ident()}-{batch}-{index}"
+            for index in range(batch_size)
+        ]
+        start = time.perf_counter()
+        try:
+            system.analyze_multiple_resumes(resumes, job_description)
+            failure = None
+        except Exception as exc:
+            failure = type(exc).__name__
+        elapsed = time.perf_counter() - start
+        # The system keeps every result for the app; drop them so memory growth
+        # reflects the pipeline and client rather than the stored results
+        system.results.clear()
+
+        with lock:
+            if failure:
+                failures[failure] += 1
+            else:
+                stats["batches"] += 1
+                stats["candidates"] += batch_size
+                stats["seconds"] += elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--median-latency", type=float, default=0.3)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-503", type=float, default=0.0)
+    parser.add_argument("--quota-rpm", type=int, default=None)
+    parser.add_argument("--report-every", type=float, default=10.0)
+    parser.add_argument("--tracemalloc", action="store_true")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with open("job_description.txt") as file:
+        job_description = file.read()
+
+    server = MockGeminiServer(
+        MockGeminiConfig(
+            median_latency=args.median_latency,
+            latency_sigma=args.latency_sigma,
+            rate_429=args.rate_429,
+            rate_503=args.rate_503,
+            quota_rpm=args.quota_rpm,
+            seed=args.seed,
+        )
+    ).start()
+
+    llm = get_llm(
+        transport="rest",
+        client_options={"api_endpoint": server.endpoint},
+        google_api_key="mock",
+    )
+    # One invoker for all workers, as in the app, so the circuit breaker sees the
+    # aggregate failure rate
+    invoker = get_invoker()
+    systems = [
+        ResumeAnalysisSystem(llm, invoker=invoker, score_cache_size=0)
+        for _ in range(args.workers)
+    ]
+
+    print(f"warm-up: {systems[0].warm_up()}")
+
+    if args.tracemalloc:
+        tracemalloc.start()
+    rss_start = max_rss_mb()
+    stats = Counter()
+    failures = Counter()
+    lock = threading.Lock()
+    stop = threading.Event()
+    threads = [
+        threading.Thread(
+            target=worker,
+            args=(
+                system,
+                job_description,
+                args.batch_size,
+                stop,
+                stats,
+                failures,
+                lock,
+            ),
+            daemon=True,
+        )
+        for system in systems
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    try:
+        while (elapsed := time.perf_counter() - start) < args.duration:
+            time.sleep(min(args.report_every, args.duration - elapsed))
+            elapsed = time.perf_counter() - start
+            with lock:
+                candidates = stats["candidates"]
+                failed = sum(failures.values())
+            line = (
+                f"[{elapsed:6.0f}s] candidates={candidates} "
+                f"({candidates / elapsed:.2f}/s) failed_batches={failed} "
+                f"max_rss={max_rss_mb():.0f}MB"
+            )
+            if args.tracemalloc:
+                current, peak = tracemalloc.get_traced_memory()
+                line += f" traced={current / 2**20:.1f}MB peak={peak / 2**20:.1f}MB"
+            print(line, flush=True)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        server.stop()
+
+    elapsed = time.perf_counter() - start
+    batches = stats["batches"] + sum(failures.values())
+    print()
+    print(f"duration:        {elapsed:.1f}s")
+    print(
+        f"throughput:      {stats['candidates'] / elapsed:.2f} candidates/s "
+        f"({stats['candidates']} candidates)"
+    )
+    if stats["batches"]:
+        print(f"mean batch time: {stats['seconds'] / stats['batches']:.2f}s")
+    print(f"batches:         {stats['batches']} ok of {batches}")
+    for name, count in failures.most_common():
+        print(f"  {name}: {count}")
+
+    requests = server.stats["requests"]
+    print(f"server requests: {requests}")
+    for status in (200, 429, 503):
+        share = server.stats[status] / requests if requests else 0.0
+        print(f"  {status}: {server.stats[status]} ({share:.1%})")
+    print(f"max rss growth:  {max_rss_mb() - rss_start:.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Local HTTP server emulating the Gemini `generateContent` REST endpoint, for load and
+soak tests of the real client path (`ChatGoogleGenerativeAI` with `transport="rest"`).
+
+Responses answer the request's function declaration with schema-shaped arguments after
+a latency drawn from a log-normal distribution. 429 and 503 errors can be injected at
+random, and a requests-per-minute quota returns 429 RESOURCE_EXHAUSTED once exceeded.
+"""
+
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from src.llm.stand_in import synthesize_from_schema
+
+
+@dataclass
+class MockGeminiConfig:
+    """
+    Attributes:
+        median_latency: Median response latency in seconds.
+        latency_sigma: Sigma of the log-normal latency distribution.
+        rate_429: Probability of answering 429 RESOURCE_EXHAUSTED.
+        rate_503: Probability of answering 503 UNAVAILABLE.
+        quota_rpm: Requests allowed per sliding minute, None for no quota.
+        seed: Seed for the random generator.
+    """
+
+    median_latency: float = 0.3
+    latency_sigma: float = 0.5
+    rate_429: float = 0.0
+    rate_503: float = 0.0
+    quota_rpm: Optional[int] = None
+    seed: Optional[int] = None
+
+
+class MockGeminiServer:
+    """Threaded mock Gemini server running in the background"""
+
+    def __init__(
+        self, config: MockGeminiConfig, host: str = "127.0.0.1", port: int = 0
+    ):
+        self.config = config
+        self.stats = Counter()
+        self._random = random.Random(config.seed)
+        self._recent = deque()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _decide(self):
+        """Returns the (status, latency) of the next response"""
+        config = self.config
+        with self._lock:
+            self.stats["requests"] += 1
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] > 60:
+                self._recent.popleft()
+            self._recent.append(now)
+            over_quota = (
+                config.quota_rpm is not None and len(self._recent) > config.quota_rpm
+            )
+            roll = self._random.random()
+            latency = 0.0
+            if config.median_latency > 0:
+                latency = self._random.lognormvariate(
+                    math.log(config.median_latency), config.latency_sigma
+                )
+
+        if over_quota or roll < config.rate_429:
+            return 429, latency / 4
+        if roll < config.rate_429 + config.rate_503:
+            return 503, latency / 4
+        return 200, latency
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.path.split("?")[0].endswith(":countTokens"):
+                    # Used by warm-up; not counted against the quota
+                    self._send(200, {"totalTokens": max(1, len(body) // 4)})
+                    return
+                if not self.path.split("?")[0].endswith(":generateContent"):
+                    self._send(404, {"error": {"code": 404, "status": "NOT_FOUND"}})
+                    return
+
+                status, latency = server._decide()
+                time.sleep(latency)
+                with server._lock:
+                    server.stats[status] += 1
+
+                if status == 429:
+                    self._send(429, _error(429, "RESOURCE_EXHAUSTED", "Quota exceeded"))
+                elif status == 503:
+                    self._send(503, _error(503, "UNAVAILABLE", "Model overloaded"))
+                else:
+                    self._send(200, _generate_content_response(json.loads(body)))
+
+            def _send(self, status, payload):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+# The REST transport sends google.ai.generativelanguage Type enums as integers
+_SCHEMA_TYPES = {
+    1: "string",
+    2: "number",
+    3: "integer",
+    4: "boolean",
+    5: "array",
+    6: "object",
+}
+
+
+def _normalize_schema(schema):
+    """Converts a function declaration schema to the JSON schema the synthesizer reads"""
+    if not isinstance(schema, dict):
+        return schema
+    normalized = dict(schema)
+    kind = schema.get("type")
+    normalized["type"] = _SCHEMA_TYPES.get(kind, str(kind).lower())
+    if "properties" in schema:
+        normalized["properties"] = {
+            key: _normalize_schema(value) for key, value in schema["properties"].items()
+        }
+    if "items" in schema:
+        normalized["items"] = _normalize_schema(schema["items"])
+    return normalized
+
+
+def _error(code: int, status: str, message: str):
+    return {"error": {"code": code, "message": message, "status": status}}
+
+
+def _generate_content_response(request):
+    declarations = [
+        declaration
+        for tool in request.get("tools", [])
+        for declaration in tool.get("functionDeclarations", [])
+    ]
+    if declarations:
+        declaration = declarations[0]
+        part = {
+            "functionCall": {
+                "name": declaration["name"],
+                "args": synthesize_from_schema(
+                    _normalize_schema(declaration.get("parameters", {}))
+                ),
+            }
+        }
+    else:
+        part = {"text": "mock response"}
+
+    prompt_chars = sum(
+        len(p.get("text", ""))
+        for content in request.get("contents", [])
+        for p in content.get("parts", [])
+    )
+    prompt_tokens = max(1, prompt_chars // 4)
+    output_tokens = max(1, len(json.dumps(part)) // 4)
+    return {
+        "candidates": [
+            {
+                "content": {"parts": [part], "role": "model"},
+                "finishReason": "STOP",
+                "index": 0,
+            }
+        ],
+        "usageMetadata": {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": output_tokens,
+            "totalTokenCount": prompt_tokens + output_tokens,
+        },
+    }
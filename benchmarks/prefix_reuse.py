@@ -0,0 +1,73 @@
+"""
+Measures how much of every stage prompt is a prefix shared with earlier candidates
+screened against the same job description, using a local stand-in model.
+
+Run from the repository root:
+
+    python -m benchmarks.prefix_reuse --candidates 50
+"""
+
+import argparse
+import random
+
+from src.llm.context_cache import ContextCacheRegistry
+from src.llm.stand_in import StandInLLM, prefix_reuse, synthesize_from_schema
+from src.models.candidate import CandidateProfile
+from src.resume_analyzer import ResumeAnalysisSystem
+
+SKILL_POOL = [
+    "Python",
+    "SQL",
+    "Docker",
+    "Kubernetes",
+    "PyTorch",
+    "React",
+    "AWS",
+    "Spark",
+    "Go",
+    "TypeScript",
+]
+
+
+def candidate_profile(prompt):
+    # Vary the extracted profile per resume so candidate payloads differ
+    rng = random.Random(prompt.to_string())
+    profile = synthesize_from_schema(CandidateProfile.model_json_schema())
+    profile["name"] = f"Candidate {rng.randint(1, 10**6)}"
+    profile["skills"] = rng.sample(SKILL_POOL, 4)
+    profile["experience"]["years_per_role"] = [
+        {"role": "Engineer", "years": f"{rng.randint(1, 9)} years"}
+    ]
+    return profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--candidates", type=int, default=50)
+    args = parser.parse_args()
+
+    with open("job_description.txt") as file:
+        job_description = file.read()
+
+    llm = StandInLLM(
+        responses={CandidateProfile: candidate_profile},
+        record_prompts=True,
+        context_caching=True,
+    )
+    # min_tokens=0 so the stand-in exercises the explicit cache path for every stage
+    system = ResumeAnalysisSystem(
+        llm,
+        score_cache_size=0,
+        context_cache=ContextCacheRegistry(min_tokens=0),
+    )
+    for index in range(args.candidates):
+        system.analyze_resume(f"resume {index}", job_description)
+
+    print(f"{'stage':>16}  shared prefix")
+    for name, ratio in sorted(prefix_reuse(llm.prompts).items()):
+        print(f"{name:>16}  {ratio:6.1%}")
+    print(f"{llm.cached_calls} of {llm.calls} calls served from an explicit cache")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Compares per-candidate latency with and without the tail-latency controls, using a
+local stand-in model that injects slow and failing calls.
+
+Run from the repository root:
+
+    python -m benchmarks.tail_latency --candidates 200
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.llm.llm_config import (
+    EDUCATION_SCORE,
+    EXPERIENCE_SCORE,
+    OTHER_SCORE,
+    SKILLS_SCORE,
+)
+from src.llm.resilience import CircuitBreaker, ResilientInvoker, StagePolicy
+from src.llm.stand_in import StandInLLM
+from src.resume_analyzer import ResumeAnalysisSystem
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(invoker, args):
+    llm = StandInLLM(
+        latency=args.latency,
+        slow_rate=args.slow_rate,
+        slow_latency=args.slow_latency,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+    system = ResumeAnalysisSystem(llm, invoker=invoker, score_cache_size=0)
+
+    def one(index):
+        start = time.perf_counter()
+        try:
+            system.analyze_resume(f"resume {index}", "job description")
+        except Exception:
+            return None
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        timings = list(pool.map(one, range(args.candidates)))
+
+    succeeded = [t for t in timings if t is not None]
+    return {
+        "p50": percentile(succeeded, 50),
+        "p95": percentile(succeeded, 95),
+        "p99": percentile(succeeded, 99),
+        "mean": statistics.mean(succeeded),
+        "failed": len(timings) - len(succeeded),
+        "llm_calls": llm.calls,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--candidates", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--slow-rate", type=float, default=0.03)
+    parser.add_argument("--slow-latency", type=float, default=1.0)
+    parser.add_argument("--failure-rate", type=float, default=0.03)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    backoff = dict(backoff_base=0.01, backoff_max=0.1)
+    scoring = StagePolicy(deadline=1.5, hedge_after=0.06, **backoff)
+    controlled = ResilientInvoker(
+        policies={
+            SKILLS_SCORE: scoring,
+            EXPERIENCE_SCORE: scoring,
+            EDUCATION_SCORE: scoring,
+            OTHER_SCORE: scoring,
+        },
+        default_policy=StagePolicy(deadline=3.0, **backoff),
+        breaker=CircuitBreaker(failure_threshold=50),
+    )
+    baseline = ResilientInvoker(
+        default_policy=StagePolicy(**backoff),
+        breaker=CircuitBreaker(failure_threshold=10**9),
+    )
+
+    for label, invoker in (("baseline", baseline), ("controlled", controlled)):
+        stats = run(invoker, args)
+        print(
+            f"{label:>10}: p50={stats['p50'] * 1000:.0f}ms "
+            f"p95={stats['p95'] * 1000:.0f}ms p99={stats['p99'] * 1000:.0f}ms "
+            f"mean={stats['mean'] * 1000:.0f}ms failed={stats['failed']} "
+            f"llm_calls={stats['llm_calls']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
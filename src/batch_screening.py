@@ -0,0 +1,346 @@
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .models.result import AnalysisResult
+from .llm.batch import (
+    parse_response,
+    read_jsonl,
+    render_request,
+    response_message,
+    write_jsonl,
+)
+from .llm.llm_config import (
+    RESUME_EXTRACTION,
+    JD_EXTRACTION,
+    SKILLS_SCORE,
+    EXPERIENCE_SCORE,
+    EDUCATION_SCORE,
+    OTHER_SCORE,
+    RECOMMENDATIONS,
+)
+from .llm.repair import StructuredOutputRepairer
+from .resume_analyzer import STAGE_SPECS
+from .utils.pdf_loader import get_current_date
+from .utils.stage_cache import canonical_key
+
+# Rounds of a batch; each one needs the outputs of the previous one
+EXTRACTION_ROUND = 0
+SCORING_ROUND = 1
+RECOMMENDATIONS_ROUND = 2
+DONE = 3
+
+STATE_FILE = "state.json"
+
+
+class BatchScreening:
+    """
+    Screens a batch of resumes against a job description through a provider's
+    asynchronous batch interface instead of interactive calls.
+
+    The pipeline advances in rounds: extraction, then the four scores, then
+    recommendations. `write_requests` renders the pending prompts of the current round
+    into JSONL request files (one per model), and `ingest` reads the JSONL response
+    files, validates them into the pipeline's Pydantic models and moves on to the next
+    round once every request of the current one is answered. Requests without a valid
+    response are sent again in the next file, up to `max_attempts` times.
+
+    The state is saved to `workdir` after every step, so a batch can be resumed with
+    `BatchScreening.load` when the responses arrive hours later.
+    """
+
+    def __init__(
+        self,
+        system,
+        resumes: List[str],
+        job_description: str,
+        workdir,
+        with_recommendations: bool = True,
+        max_attempts: int = 3,
+    ):
+        """
+        Args:
+            system: The ResumeAnalysisSystem providing models, weights, rule scoring
+                and repair.
+            resumes: A list of resume texts.
+            job_description: The text content of the job description.
+            workdir: Directory for the request files and the saved state.
+            with_recommendations: Whether to run the recommendations round.
+            max_attempts: How many times a request is sent before its candidate is
+                given up.
+        """
+        self.system = system
+        self.resumes = resumes
+        self.job_description = job_description
+        self.workdir = Path(workdir)
+        self.with_recommendations = with_recommendations
+        self.max_attempts = max_attempts
+        self.round = EXTRACTION_ROUND
+        self.pending: Dict[str, Dict] = {}
+        self.outputs: Dict[str, Dict] = {}
+        self.failed: Dict[int, str] = {}
+        self.candidates: List[Dict[str, str]] = []
+
+        job_key = self._request(JD_EXTRACTION, {"jd_text": job_description})
+        for resume in resumes:
+            resume_key = self._request(
+                RESUME_EXTRACTION,
+                {"resume_text": resume, "current_date": get_current_date()},
+            )
+            self.candidates.append({"resume": resume_key, "job": job_key})
+
+        self.workdir.mkdir(parents=True, exist_ok=True)
+        self.save()
+
+    @property
+    def done(self) -> bool:
+        return self.round == DONE
+
+    def _request(self, stage: str, inputs: Dict) -> str:
+        """Queues a request for the current round, once per distinct input"""
+        key = f"{stage}-{canonical_key(stage, inputs)[:32]}"
+        if key not in self.outputs and key not in self.pending:
+            self.pending[key] = {"stage": stage, "inputs": inputs, "attempts": 0}
+        return key
+
+    def _local(self, stage: str, inputs: Dict, output) -> str:
+        """Stores an output computed locally, without a request"""
+        key = f"{stage}-{canonical_key(stage, inputs)[:32]}"
+        self.outputs[key] = output.model_dump()
+        return key
+
+    def _output(self, key: str):
+        stage = key.rsplit("-", 1)[0]
+        return STAGE_SPECS[stage][0].model_validate(self.outputs[key])
+
+    def _model_name(self, stage: str) -> str:
+        llm = self.system.router.for_stage(stage)
+        name = str(getattr(llm, "model", None) or "default")
+        return re.sub(r"[^A-Za-z0-9._-]+", "-", name.split("/")[-1])
+
+    def write_requests(self) -> Dict[str, Path]:
+        """
+        Writes the pending requests of the current round.
+
+        Returns:
+            The request file written per model name, empty when nothing is pending.
+        """
+        lines: Dict[str, List[Dict]] = {}
+        for key, item in list(self.pending.items()):
+            if item["attempts"] >= self.max_attempts:
+                self._give_up(key, "no valid response")
+                continue
+            item["attempts"] += 1
+            stage = item["stage"]
+            schema, template = STAGE_SPECS[stage]
+            llm = self.system.router.for_stage(stage)
+            lines.setdefault(self._model_name(stage), []).append(
+                render_request(
+                    key,
+                    template.format_messages(**item["inputs"]),
+                    schema,
+                    getattr(llm, "temperature", None),
+                )
+            )
+
+        paths = {}
+        for model, model_lines in lines.items():
+            attempt = max(self.pending[line["key"]]["attempts"] for line in model_lines)
+            path = self.workdir / f"round{self.round}-{model}-{attempt}.jsonl"
+            write_jsonl(path, model_lines)
+            paths[model] = path
+
+        self._advance()
+        self.save()
+        return paths
+
+    def ingest(self, *paths) -> int:
+        """
+        Reads response files and advances the batch as far as the responses allow.
+
+        Args:
+            *paths: JSONL response files, each line holding the `key` of its request.
+
+        Returns:
+            The number of requests still pending in the current round.
+        """
+        for path in paths:
+            for line in read_jsonl(path):
+                key = line.get("key")
+                if key not in self.pending:
+                    continue
+                schema = STAGE_SPECS[self.pending[key]["stage"]][0]
+                repairer = StructuredOutputRepairer(schema, self.system.repair_stats)
+                output, _ = parse_response(response_message(line), repairer)
+                if output is not None:
+                    self.outputs[key] = output.model_dump()
+                    del self.pending[key]
+
+        self._advance()
+        self.save()
+        return len(self.pending)
+
+    def _give_up(self, key: str, reason: str):
+        stage = self.pending.pop(key)["stage"]
+        for index, keys in enumerate(self.candidates):
+            if key in keys.values() and index not in self.failed:
+                self.failed[index] = f"{stage}: {reason}"
+
+    def _advance(self):
+        """Moves to the next round while the current one has nothing pending"""
+        while not self.pending and not self.done:
+            self.round += 1
+            if self.round == SCORING_ROUND:
+                self._queue_scores()
+            elif self.round == RECOMMENDATIONS_ROUND and self.with_recommendations:
+                self._queue_recommendations()
+
+    def _active(self):
+        return [
+            (index, keys)
+            for index, keys in enumerate(self.candidates)
+            if index not in self.failed
+        ]
+
+    def _queue_scores(self):
+        rules = self.system.rule_scorer
+        for _, keys in self._active():
+            resume = self._output(keys["resume"])
+            job = self._output(keys["job"])
+            keys[SKILLS_SCORE] = self._request(
+                SKILLS_SCORE,
+                {
+                    "resume_skills": resume.skills,
+                    "required_skills": job.required_skills,
+                },
+            )
+
+            sections = (
+                (
+                    EXPERIENCE_SCORE,
+                    "experience",
+                    "resume_exp",
+                    "required_exp",
+                    resume.experience.model_dump(),
+                    job.required_experience.model_dump(),
+                ),
+                (
+                    EDUCATION_SCORE,
+                    "education",
+                    "resume_edu",
+                    "required_edu",
+                    resume.education.model_dump(),
+                    job.required_education.model_dump(),
+                ),
+                (
+                    OTHER_SCORE,
+                    "other",
+                    "resume_other",
+                    "required_other",
+                    resume.other_skills.model_dump(),
+                    job.other_requirements.model_dump(),
+                ),
+            )
+            for (
+                stage,
+                section,
+                resume_name,
+                job_name,
+                resume_part,
+                job_part,
+            ) in sections:
+                inputs = {
+                    resume_name: json.dumps(resume_part),
+                    job_name: json.dumps(job_part),
+                }
+                local = rules.score(section, resume_part, job_part) if rules else None
+                if local is not None:
+                    keys[stage] = self._local(stage, inputs, local)
+                else:
+                    keys[stage] = self._request(stage, inputs)
+
+    def _queue_recommendations(self):
+        for _, keys in self._active():
+            resume = self._output(keys["resume"])
+            job = self._output(keys["job"])
+            skills = self._output(keys[SKILLS_SCORE])
+            keys[RECOMMENDATIONS] = self._request(
+                RECOMMENDATIONS,
+                {
+                    "jd_text": self.job_description,
+                    "required_experience": json.dumps(
+                        job.required_experience.model_dump()
+                    ),
+                    "matching_skills": json.dumps(skills.matching_skills),
+                    "missing_skills": json.dumps(skills.missing_skills),
+                    "candidate_experience": json.dumps(resume.experience.model_dump()),
+                },
+            )
+
+    def results(self) -> List[Optional[AnalysisResult]]:
+        """
+        Returns one AnalysisResult per resume, None for candidates in `failed`.
+
+        Raises:
+            RuntimeError: If the batch has not gone through every round yet.
+        """
+        if not self.done:
+            raise RuntimeError(f"Batch still in round {self.round}")
+
+        results = []
+        for index, keys in enumerate(self.candidates):
+            if index in self.failed:
+                results.append(None)
+                continue
+            recommendations = keys.get(RECOMMENDATIONS)
+            results.append(
+                AnalysisResult(
+                    candidate=self._output(keys["resume"]),
+                    skills=self._output(keys[SKILLS_SCORE]),
+                    experience=self._output(keys[EXPERIENCE_SCORE]),
+                    education=self._output(keys[EDUCATION_SCORE]),
+                    other=self._output(keys[OTHER_SCORE]),
+                    recommendations=(
+                        self._output(recommendations) if recommendations else None
+                    ),
+                    weights=self.system.weights,
+                )
+            )
+        return results
+
+    def save(self):
+        """Writes the batch state to `workdir`"""
+        state = {
+            "resumes": self.resumes,
+            "job_description": self.job_description,
+            "with_recommendations": self.with_recommendations,
+            "max_attempts": self.max_attempts,
+            "round": self.round,
+            "pending": self.pending,
+            "outputs": self.outputs,
+            "failed": self.failed,
+            "candidates": self.candidates,
+        }
+        with open(self.workdir / STATE_FILE, "w", encoding="utf-8") as file:
+            json.dump(state, file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, system, workdir) -> "BatchScreening":
+        """Restores a batch saved in `workdir`"""
+        with open(Path(workdir) / STATE_FILE, encoding="utf-8") as file:
+            state = json.load(file)
+
+        batch = cls.__new__(cls)
+        batch.system = system
+        batch.workdir = Path(workdir)
+        batch.resumes = state["resumes"]
+        batch.job_description = state["job_description"]
+        batch.with_recommendations = state["with_recommendations"]
+        batch.max_attempts = state["max_attempts"]
+        batch.round = state["round"]
+        batch.pending = state["pending"]
+        batch.outputs = state["outputs"]
+        batch.failed = {int(index): reason for index, reason in state["failed"].items()}
+        batch.candidates = state["candidates"]
+        return batch
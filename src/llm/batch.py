@@ -0,0 +1,160 @@
+import json
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage, BaseMessage
+from pydantic import BaseModel
+
+from .context_cache import tool_call_output
+from .repair import StructuredOutputRepairer
+
+# JSON schema keys understood by the Gemini response schema
+_SCHEMA_KEYS = ("description", "enum", "format", "nullable", "required")
+
+
+def gemini_schema(schema: Dict, root: Optional[Dict] = None) -> Dict:
+    """
+    Converts a Pydantic JSON schema into a Gemini response schema.
+
+    `$ref` entries are inlined, types are upper-cased and keys the API does not accept
+    (title, default, ...) are dropped.
+    """
+    root = root or schema
+    if "$ref" in schema:
+        ref = schema["$ref"].split("/")[-1]
+        return gemini_schema(root["$defs"][ref], root)
+    if "anyOf" in schema:
+        options = [option for option in schema["anyOf"] if option.get("type") != "null"]
+        converted = gemini_schema(options[0], root)
+        converted["nullable"] = len(options) < len(schema["anyOf"])
+        return converted
+
+    converted = {"type": str(schema.get("type", "object")).upper()}
+    converted.update({key: schema[key] for key in _SCHEMA_KEYS if key in schema})
+    if "properties" in schema:
+        converted["properties"] = {
+            name: gemini_schema(value, root)
+            for name, value in schema["properties"].items()
+        }
+    if "items" in schema:
+        converted["items"] = gemini_schema(schema["items"], root)
+    return converted
+
+
+def render_request(
+    key: str,
+    messages: List[BaseMessage],
+    schema: Type[BaseModel],
+    temperature: Optional[float] = None,
+) -> Dict:
+    """
+    Renders one line of a Gemini batch request file.
+
+    System messages become the system instruction and the other messages the parts of
+    a single user turn. The structured output is requested as JSON following `schema`.
+
+    Args:
+        key: Identifier echoed back on the matching response line.
+        messages: The rendered prompt messages.
+        schema: The Pydantic class the response has to validate against.
+        temperature: Sampling temperature, None for the provider default.
+    """
+    system = [message.content for message in messages if message.type == "system"]
+    parts = [
+        {"text": message.content} for message in messages if message.type != "system"
+    ]
+    generation_config = {
+        "response_mime_type": "application/json",
+        "response_schema": gemini_schema(schema.model_json_schema()),
+    }
+    if temperature is not None:
+        generation_config["temperature"] = temperature
+
+    request = {
+        "contents": [{"role": "user", "parts": parts}],
+        "generation_config": generation_config,
+    }
+    if system:
+        request["system_instruction"] = {"parts": [{"text": text} for text in system]}
+    return {"key": key, "request": request}
+
+
+def read_jsonl(path) -> Iterator[Dict]:
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_jsonl(path, lines: List[Dict]):
+    with open(path, "w", encoding="utf-8") as file:
+        for line in lines:
+            file.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+
+def response_message(line: Dict) -> Optional[AIMessage]:
+    """
+    Turns one line of a Gemini batch response file into an AIMessage.
+
+    Returns:
+        The message with its text, function calls and usage metadata, or None when the
+        line carries an error or no candidate.
+    """
+    response = line.get("response") or {}
+    candidates = response.get("candidates") or []
+    if line.get("error") or not candidates:
+        return None
+
+    parts = candidates[0].get("content", {}).get("parts", [])
+    text = "".join(part.get("text", "") for part in parts)
+    tool_calls = [
+        {
+            "name": part["functionCall"]["name"],
+            "args": part["functionCall"].get("args", {}),
+            "id": f"{line.get('key')}-{index}",
+        }
+        for index, part in enumerate(parts)
+        if "functionCall" in part
+    ]
+    usage = response.get("usageMetadata") or {}
+    input_tokens = usage.get("promptTokenCount", 0)
+    output_tokens = usage.get("candidatesTokenCount", 0)
+    return AIMessage(
+        content=text,
+        tool_calls=tool_calls,
+        usage_metadata={
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": usage.get("totalTokenCount", input_tokens + output_tokens),
+        },
+    )
+
+
+def parse_response(
+    message: Optional[AIMessage], repairer: StructuredOutputRepairer
+) -> Tuple[Optional[BaseModel], Optional[str]]:
+    """
+    Validates a batch response into the repairer's Pydantic class.
+
+    Returns:
+        (model, None) on success, (None, reason) when the response is missing or cannot
+        be repaired.
+    """
+    if message is None:
+        return None, "no response"
+
+    schema = repairer.schema
+    if message.tool_calls:
+        output = tool_call_output(schema)(message)
+    else:
+        try:
+            output = {
+                "raw": message,
+                "parsed": schema.model_validate_json(message.content),
+            }
+        except ValueError:
+            output = {"raw": message, "parsed": None}
+    try:
+        return repairer(output), None
+    except OutputParserException as exc:
+        return None, str(exc)
@@ -0,0 +1,219 @@
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .llm_config import (
+    FUSED_SCORE,
+    RECOMMENDATIONS,
+    RESUME_EXTRACTION,
+    SCORING_STAGES,
+    STAGE_TOKEN_ESTIMATES,
+)
+
+# Modes a candidate can be analyzed in, from the most to the least expensive
+FULL = "full"
+SKIP_RECOMMENDATIONS = "skip_recommendations"
+FUSED_SCORING = "fused_scoring"
+STOP = "stop"
+
+# Usage of the candidate currently being analyzed. Copied into the invoker's worker
+# threads with the rest of the context, so chains can record usage without a handle.
+_active_usage: ContextVar[Optional["CandidateUsage"]] = ContextVar(
+    "active_usage", default=None
+)
+
+
+class CandidateUsage:
+    """Tokens spent on one candidate, also counted against the batch budget"""
+
+    def __init__(self, budget: "TokenBudget"):
+        self.budget = budget
+        self.tokens = 0
+        self.stages: Dict[str, int] = Counter()
+
+    def record(self, stage: str, tokens: int):
+        self.budget.record(stage, tokens, self)
+
+
+def usage_meter(stage: str):
+    """
+    Returns a chain step recording the token usage of a structured output response.
+
+    The step receives the `include_raw=True` output shape, reads `usage_metadata` from
+    the raw AIMessage and charges it to the candidate being analyzed, if any. The output
+    is passed through unchanged.
+    """
+
+    def meter(output):
+        usage = getattr(output.get("raw"), "usage_metadata", None)
+        tracker = _active_usage.get()
+        if usage and tracker is not None:
+            tracker.record(stage, usage.get("total_tokens", 0))
+        return output
+
+    return meter
+
+
+class TokenBudget:
+    """
+    Token budget of a batch and of each candidate in it, with graceful degradation.
+
+    Spend is tracked from the usage metadata of every response, hedged duplicates and
+    fallback calls included. Before scoring a candidate the budget picks the most
+    complete mode whose estimated cost still fits: the full analysis, the analysis
+    without recommendations, or a single fused scoring call. When not even resume
+    extraction and the cheapest allowed mode fit, in the batch or in a single
+    candidate's budget, the batch stops before spending on the next candidate and the
+    remaining candidates are reported in `unprocessed`. Work shared by every candidate,
+    such as the job description extraction, is charged to the batch only.
+
+    Until a stage has been observed its cost comes from `stage_estimates`. With the
+    defaults a candidate needs about 4,300 tokens (resume extraction plus fused
+    scoring), so a smaller `candidate_tokens` processes nothing; pass estimates measured
+    for your prompts and model when setting tight budgets.
+    """
+
+    def __init__(
+        self,
+        batch_tokens: Optional[int] = None,
+        candidate_tokens: Optional[int] = None,
+        degrade: Sequence[str] = (SKIP_RECOMMENDATIONS, FUSED_SCORING),
+        stage_estimates: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Args:
+            batch_tokens: Tokens the whole batch may spend. None for no limit.
+            candidate_tokens: Tokens a single candidate may spend. None for no limit.
+            degrade: The cheaper modes allowed when the budget runs low, in the order
+                they are tried.
+            stage_estimates: Expected tokens per stage, used until responses for the
+                stage have been observed. Defaults to STAGE_TOKEN_ESTIMATES.
+        """
+        self.batch_tokens = batch_tokens
+        self.candidate_tokens = candidate_tokens
+        self.degrade = tuple(degrade)
+        self.stage_estimates = dict(stage_estimates or STAGE_TOKEN_ESTIMATES)
+        self.used = 0
+        self.modes = Counter()
+        self.unprocessed: List[int] = []
+        self._observed = Counter()
+        self._responses = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> Optional[int]:
+        if self.batch_tokens is None:
+            return None
+        return max(0, self.batch_tokens - self.used)
+
+    def record(
+        self, stage: str, tokens: int, candidate: Optional[CandidateUsage] = None
+    ):
+        """Charges the tokens of one response to the batch and to `candidate`"""
+        with self._lock:
+            if candidate is not None:
+                candidate.tokens += tokens
+                candidate.stages[stage] += tokens
+            self.used += tokens
+            self._observed[stage] += tokens
+            self._responses[stage] += 1
+
+    def estimate(self, stages: Iterable[str]) -> int:
+        """Expected tokens of the given stages, from observed usage where available"""
+        with self._lock:
+            return sum(
+                (
+                    self._observed[stage] // self._responses[stage]
+                    if self._responses[stage]
+                    else self.stage_estimates.get(stage, 0)
+                )
+                for stage in stages
+            )
+
+    def _fits(self, stages: Iterable[str], candidate: Optional[CandidateUsage]) -> bool:
+        cost = self.estimate(stages)
+        remaining = self.remaining
+        if remaining is not None and cost > remaining:
+            return False
+        if self.candidate_tokens is not None:
+            spent = candidate.tokens if candidate is not None else 0
+            if spent + cost > self.candidate_tokens:
+                return False
+        return True
+
+    def can_start(self, shared_stages: Sequence[str] = ()) -> bool:
+        """
+        Whether a new candidate fits before any tokens are spent on it: resume
+        extraction plus the cheapest allowed mode has to fit both the remaining batch
+        budget and the per-candidate budget.
+
+        Args:
+            shared_stages: Stages shared by every candidate that have not run yet (e.g.
+                JD_EXTRACTION before the first candidate), counted against the batch
+                budget only.
+        """
+        cheapest = min(
+            (self._mode_stages(mode) for mode in (FULL,) + self.degrade),
+            key=self.estimate,
+        )
+        cost = self.estimate((RESUME_EXTRACTION,) + cheapest)
+        if self.candidate_tokens is not None and cost > self.candidate_tokens:
+            return False
+        remaining = self.remaining
+        return remaining is None or cost + self.estimate(shared_stages) <= remaining
+
+    def plan(self) -> str:
+        """
+        Picks the mode for scoring the current candidate.
+
+        Returns:
+            FULL, one of the allowed degraded modes, or STOP when none of them fits.
+        """
+        candidate = _active_usage.get()
+        for mode in (FULL,) + self.degrade:
+            if self._fits(self._mode_stages(mode), candidate):
+                self.modes[mode] += 1
+                return mode
+        self.modes[STOP] += 1
+        return STOP
+
+    @staticmethod
+    def _mode_stages(mode: str) -> tuple:
+        if mode == FULL:
+            return SCORING_STAGES + (RECOMMENDATIONS,)
+        if mode == SKIP_RECOMMENDATIONS:
+            return SCORING_STAGES
+        return (FUSED_SCORE,)
+
+    @contextmanager
+    def shared(self):
+        """Charges the usage recorded inside the block to the batch only"""
+        token = _active_usage.set(CandidateUsage(self))
+        try:
+            yield
+        finally:
+            _active_usage.reset(token)
+
+    @contextmanager
+    def candidate(self):
+        """Charges the usage recorded inside the block to a new candidate"""
+        usage = CandidateUsage(self)
+        token = _active_usage.set(usage)
+        try:
+            yield usage
+        finally:
+            _active_usage.reset(token)
+
+    def report(self) -> Dict:
+        """Summary of the batch spend, the modes used and the unprocessed candidates"""
+        with self._lock:
+            per_stage = dict(self._observed)
+        return {
+            "used": self.used,
+            "remaining": self.remaining,
+            "tokens_per_stage": per_stage,
+            "modes": dict(self.modes),
+            "unprocessed": list(self.unprocessed),
+        }
@@ -0,0 +1,137 @@
+import hashlib
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Type
+
+from langchain_core.exceptions import OutputParserException
+from pydantic import BaseModel, ValidationError
+
+from ..utils.singleflight import SingleFlight
+
+
+class ContextCacheRegistry:
+    """
+    Creates and remembers one explicit provider context cache per prompt prefix.
+
+    The prefix is the system message, instructions and job description side of a stage
+    prompt, so every candidate screened against the same job shares one handle. Caches
+    are only created for prefixes long enough for the provider to accept them, and only
+    for models exposing `create_cached_content` (ChatGoogleGenerativeAI). Any failure to
+    create a cache is remembered and the stage falls back to sending the full prompt.
+
+    Handles are kept until shortly before the cache's `ttl` runs out; the next request
+    for the prefix then creates a new cache. Concurrent requests for the same prefix
+    share one creation call; other prefixes do not wait for it.
+    """
+
+    def __init__(
+        self,
+        min_tokens: int = 32768,
+        ttl: int = 3600,
+        chars_per_token: int = 4,
+        refresh_before: float = 120.0,
+    ):
+        """
+        Args:
+            min_tokens: Minimum estimated prefix size in tokens the provider accepts
+                for explicit caching (32k for Gemini 1.5).
+            ttl: Lifetime of a created cache in seconds. A failed creation is retried
+                after the same time.
+            chars_per_token: Characters per token used to estimate the prefix size.
+            refresh_before: Seconds before the cache expires at which its handle stops
+                being handed out, leaving calls already using it time to finish.
+        """
+        self.min_tokens = min_tokens
+        self.ttl = ttl
+        self.chars_per_token = chars_per_token
+        self.refresh_before = refresh_before
+        # Prefix key -> (handle, monotonic time until which it is handed out)
+        self._handles: Dict[Tuple, Tuple[Optional[str], float]] = {}
+        self._inflight = SingleFlight()
+        self._lock = threading.Lock()
+
+    def handle_for(
+        self, llm, stage: str, messages: List, schema: Type[BaseModel]
+    ) -> Optional[str]:
+        """
+        Returns the cache handle for the given prefix messages, creating it on first use
+        and again once the previous cache is about to expire.
+
+        Args:
+            llm: The chat model serving the stage.
+            stage: The pipeline stage name.
+            messages: The rendered prefix messages.
+            schema: The Pydantic class the stage answers with, cached as the only tool.
+
+        Returns:
+            The provider cache name, or None when the prefix is not cached.
+        """
+        if not hasattr(llm, "create_cached_content"):
+            return None
+
+        text = "".join(str(message.content) for message in messages)
+        if len(text) / self.chars_per_token < self.min_tokens:
+            return None
+
+        key = (
+            getattr(llm, "model", id(llm)),
+            stage,
+            hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        )
+        handle, valid = self._lookup(key)
+        if valid:
+            return handle
+        return self._inflight.do(key, lambda: self._create(key, llm, messages, schema))
+
+    def invalidate(self, handle: str):
+        """Forgets a handle the provider no longer accepts, e.g. expired early"""
+        with self._lock:
+            for key, (known, _) in list(self._handles.items()):
+                if known == handle:
+                    del self._handles[key]
+
+    def _lookup(self, key: Tuple) -> Tuple[Optional[str], bool]:
+        with self._lock:
+            handle, valid_until = self._handles.get(key, (None, 0.0))
+        return handle, time.monotonic() < valid_until
+
+    def _create(
+        self, key: Tuple, llm, messages: List, schema: Type[BaseModel]
+    ) -> Optional[str]:
+        # Filled by a creation that finished after the caller's lookup
+        handle, valid = self._lookup(key)
+        if valid:
+            return handle
+        try:
+            handle = llm.create_cached_content(
+                messages,
+                tools=[schema],
+                tool_choice=schema.__name__,
+                ttl=self.ttl,
+            )
+        except Exception:
+            handle = None
+        valid_until = (
+            time.monotonic() + self.ttl - (self.refresh_before if handle else 0)
+        )
+        with self._lock:
+            self._handles[key] = (handle, valid_until)
+        return handle
+
+
+def tool_call_output(schema: Type[BaseModel]):
+    """
+    Returns a function turning an AIMessage into the `include_raw=True` output shape
+    of `with_structured_output`, for chains that call the model without binding tools.
+    """
+
+    def parse(message) -> Dict:
+        try:
+            if not message.tool_calls:
+                raise OutputParserException("The model did not call the tool")
+            parsed = schema.model_validate(message.tool_calls[0]["args"])
+        except (OutputParserException, ValidationError) as exc:
+            return {"raw": message, "parsed": None, "parsing_error": exc}
+        return {"raw": message, "parsed": parsed, "parsing_error": None}
+
+    return parse
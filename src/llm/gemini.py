@@ -0,0 +1,53 @@
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_google_genai.chat_models import _response_to_result
+
+
+class GeminiChat(ChatGoogleGenerativeAI):
+    """
+    ChatGoogleGenerativeAI sending each request exactly once, bounded by `timeout`.
+
+    langchain-google-genai 2.0.8 wraps every request in its own retry (two attempts,
+    regardless of `max_retries`) and never passes `timeout` to the client, so a hung
+    request holds its thread indefinitely. Retries belong to the ResilientInvoker, which
+    applies stage deadlines and the circuit breaker, so this client only sends the
+    request, with the transport timeout set and the client library's retry disabled.
+    """
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        *,
+        tools=None,
+        functions=None,
+        safety_settings=None,
+        tool_config=None,
+        generation_config: Optional[Dict[str, Any]] = None,
+        cached_content: Optional[str] = None,
+        tool_choice=None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        request = self._prepare_request(
+            messages,
+            stop=stop,
+            tools=tools,
+            functions=functions,
+            safety_settings=safety_settings,
+            tool_config=tool_config,
+            generation_config=generation_config,
+            cached_content=cached_content or self.cached_content,
+            tool_choice=tool_choice,
+        )
+        response = self.client.generate_content(
+            request=request,
+            metadata=self.default_metadata,
+            timeout=self.timeout,
+            retry=None,
+            **kwargs,
+        )
+        return _response_to_result(response)
@@ -1,14 +1,169 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
+import threading
 
+from .resilience import CircuitBreaker, ResilientInvoker, StagePolicy
+from .router import LLMRouter
 
-def get_llm():
+# Pipeline stages, one per LLM call made for a candidate
+RESUME_EXTRACTION = "resume_extraction"
+JD_EXTRACTION = "jd_extraction"
+SKILLS_SCORE = "skills_score"
+EXPERIENCE_SCORE = "experience_score"
+EDUCATION_SCORE = "education_score"
+OTHER_SCORE = "other_score"
+RECOMMENDATIONS = "recommendations"
+# Single call scoring all four sections, used when a token budget runs low
+FUSED_SCORE = "fused_score"
+
+STAGES = (
+    RESUME_EXTRACTION,
+    JD_EXTRACTION,
+    SKILLS_SCORE,
+    EXPERIENCE_SCORE,
+    EDUCATION_SCORE,
+    OTHER_SCORE,
+    RECOMMENDATIONS,
+    FUSED_SCORE,
+)
+SCORING_STAGES = (SKILLS_SCORE, EXPERIENCE_SCORE, EDUCATION_SCORE, OTHER_SCORE)
+
+# Transport timeout of a single request to the provider (seconds)
+REQUEST_TIMEOUT = 60
+
+# Keep-alive connections per client with the REST transport. The default gRPC
+# transport multiplexes every request of a client over one channel instead.
+REST_POOL_SIZE = 64
+
+# Deadlines cover all retries of a stage. The short scoring calls are hedged:
+# a duplicate request goes out once the first one is slower than roughly p95.
+STAGE_POLICIES = {
+    RESUME_EXTRACTION: StagePolicy(deadline=90.0),
+    JD_EXTRACTION: StagePolicy(deadline=90.0),
+    SKILLS_SCORE: StagePolicy(deadline=30.0, hedge_after=6.0),
+    EXPERIENCE_SCORE: StagePolicy(deadline=30.0, hedge_after=6.0),
+    EDUCATION_SCORE: StagePolicy(deadline=30.0, hedge_after=6.0),
+    OTHER_SCORE: StagePolicy(deadline=30.0, hedge_after=6.0),
+    RECOMMENDATIONS: StagePolicy(deadline=120.0),
+    FUSED_SCORE: StagePolicy(deadline=45.0),
+}
+
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30.0
+
+# Model and parameters per stage. The mechanical extraction and scoring stages run on
+# the cheap high-throughput model, recommendations on the stronger one.
+FAST_MODEL = {"model": "gemini-1.5-flash-8b", "temperature": 0}
+STRONG_MODEL = {"model": "gemini-1.5-pro", "temperature": 0}
+
+STAGE_MODELS = {
+    RESUME_EXTRACTION: FAST_MODEL,
+    JD_EXTRACTION: FAST_MODEL,
+    SKILLS_SCORE: FAST_MODEL,
+    EXPERIENCE_SCORE: FAST_MODEL,
+    EDUCATION_SCORE: FAST_MODEL,
+    OTHER_SCORE: FAST_MODEL,
+    RECOMMENDATIONS: STRONG_MODEL,
+    FUSED_SCORE: FAST_MODEL,
+}
+
+# Expected tokens (prompt + response) per stage, used by TokenBudget until it has
+# observed real usage for the stage
+STAGE_TOKEN_ESTIMATES = {
+    RESUME_EXTRACTION: 2500,
+    JD_EXTRACTION: 2000,
+    SKILLS_SCORE: 900,
+    EXPERIENCE_SCORE: 1000,
+    EDUCATION_SCORE: 900,
+    OTHER_SCORE: 900,
+    RECOMMENDATIONS: 2500,
+    FUSED_SCORE: 1800,
+}
+
+# Model used when a stage's structured output fails validation, and the stages
+# allowed to fall back to it (None means all of them)
+FALLBACK_MODEL = STRONG_MODEL
+FALLBACK_STAGES = None
+
+
+def get_llm(model="gemini-1.5-flash", temperature=0, **kwargs):
     """
     Returns a LangChain LLM Runnable
+
+    Args:
+        model: Name of the Gemini model.
+        temperature: Sampling temperature.
+        **kwargs: Additional ChatGoogleGenerativeAI parameters.
+    """
+    # Imported lazily: the provider SDK is the heaviest import of the library path
+    from .gemini import GeminiChat
+
+    # GeminiChat sends each request once with REQUEST_TIMEOUT as the transport
+    # timeout; retries are handled per stage by the ResilientInvoker
+    params = {"max_tokens": None, "timeout": REQUEST_TIMEOUT, "max_retries": 0}
+    params.update(kwargs)
+    llm = GeminiChat(model=model, temperature=temperature, **params)
+    if params.get("transport") == "rest":
+        _mount_rest_pool(llm, REST_POOL_SIZE)
+    return llm
+
+
+def _mount_rest_pool(llm, pool_size):
+    # The REST transport sends requests through a requests session that keeps only 10
+    # connections per host, so concurrent calls beyond that reconnect every time
+    session = getattr(getattr(llm.client, "_transport", None), "_session", None)
+    if session is None:
+        return
+    from requests.adapters import HTTPAdapter
+
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+# Clients shared by every router of the process, one per configuration
+_shared_clients = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_llm(**config):
+    """
+    Returns the process-wide client for a configuration, creating it on first use
+
+    Args:
+        **config: get_llm parameters.
+    """
+    key = repr(sorted(config.items()))
+    with _shared_clients_lock:
+        if key not in _shared_clients:
+            _shared_clients[key] = get_llm(**config)
+        return _shared_clients[key]
+
+
+def get_router(fallback=True):
+    """
+    Returns an LLMRouter serving each stage with the model configured in STAGE_MODELS
+
+    Args:
+        fallback: Whether stages fall back to FALLBACK_MODEL when validation fails.
+    """
+    # Stages sharing a configuration share one client, as do routers
+    return LLMRouter(
+        stage_llms={
+            stage: get_shared_llm(**config) for stage, config in STAGE_MODELS.items()
+        },
+        default=get_shared_llm(**FAST_MODEL),
+        fallback=get_shared_llm(**FALLBACK_MODEL) if fallback else None,
+        fallback_stages=FALLBACK_STAGES,
+    )
+
+
+def get_invoker():
+    """
+    Returns a ResilientInvoker configured with the per-stage latency policies
     """
-    return ChatGoogleGenerativeAI(
-        model="gemini-1.5-flash",
-        temperature=0,
-        max_tokens=None,
-        timeout=None,
-        max_retries=2,
+    return ResilientInvoker(
+        policies=STAGE_POLICIES,
+        breaker=CircuitBreaker(
+            failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=CIRCUIT_RESET_TIMEOUT,
+        ),
     )
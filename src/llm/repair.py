@@ -0,0 +1,237 @@
+import json
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Type, get_args, get_origin
+
+from langchain_core.exceptions import OutputParserException
+from pydantic import BaseModel, ValidationError
+
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+# Shown instead of the field's placeholder default when the model gave no reason
+MISSING_REASON = "No reason provided."
+
+
+class RepairStats:
+    """Thread-safe counters of how often each local repair fires"""
+
+    def __init__(self):
+        self.counts = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, kind: str):
+        with self._lock:
+            self.counts[kind] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+
+def load_truncated_json(text: str) -> Any:
+    """
+    Parses JSON that may have been cut off mid-way.
+
+    The text is cut back to the last complete value and the open objects and arrays
+    are closed, so a cut-off string or number is dropped rather than kept as a
+    fragment. Returns None when nothing parseable remains.
+    """
+    stack: List[str] = []
+    in_string = False
+    escaped = False
+    cut_points = []
+
+    for index, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+                cut_points.append((index + 1, tuple(stack)))
+            continue
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            if stack:
+                stack.pop()
+            cut_points.append((index + 1, tuple(stack)))
+        elif char == ",":
+            cut_points.append((index, tuple(stack)))
+        elif char in "el":
+            # End of true, false or null. A number is only known to be complete once
+            # the comma or bracket after it is reached.
+            cut_points.append((index + 1, tuple(stack)))
+
+    for end, open_stack in reversed(cut_points[-64:]):
+        candidate = text[:end].rstrip().rstrip(",") + "".join(reversed(open_stack))
+        try:
+            return json.loads(candidate)
+        except ValueError:
+            continue
+    return None
+
+
+def extract_payload(raw, stats: RepairStats) -> Optional[Any]:
+    """
+    Recovers the structured payload from a raw AIMessage whose parsing failed.
+
+    Looks at tool call arguments first, then at tool calls whose arguments were not valid
+    JSON, then at the plain text content.
+    """
+    if raw is None:
+        return None
+    if getattr(raw, "tool_calls", None):
+        return raw.tool_calls[0]["args"]
+
+    texts = [call.get("args") for call in getattr(raw, "invalid_tool_calls", []) or []]
+    if isinstance(getattr(raw, "content", None), str):
+        texts.append(raw.content)
+
+    for text in texts:
+        if not isinstance(text, str) or not text.strip():
+            continue
+        text = _CODE_FENCE.sub("", text.strip())
+        try:
+            return json.loads(text)
+        except ValueError:
+            payload = load_truncated_json(text)
+            if payload is not None:
+                stats.record("close_truncated_json")
+                return payload
+    return None
+
+
+def _coerce_number(value: Any, stats: RepairStats) -> Any:
+    if isinstance(value, bool) or isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        stats.record("coerce_numeric")
+        return round(value)
+    if isinstance(value, str):
+        match = _NUMBER.search(value)
+        if match:
+            stats.record("coerce_numeric")
+            return round(float(match.group()))
+    return value
+
+
+def _clamp_score(value: Any, stats: RepairStats) -> Any:
+    if isinstance(value, int) and not 0 <= value <= 100:
+        stats.record("clamp_score")
+        return min(100, max(0, value))
+    return value
+
+
+def repair_payload(data: Any, schema: Type[BaseModel], stats: RepairStats) -> Any:
+    """
+    Applies local fixes to a payload so that it validates against `schema`.
+
+    - Numeric strings and floats in integer fields are coerced ("85", "85/100", 85.5).
+    - `score` fields are clamped to 0-100.
+    - Missing fields take their default, missing lists become empty. A missing
+      `reason` is filled with MISSING_REASON rather than its placeholder default.
+    - A bare value in a list field is wrapped in a list.
+    Nested models are repaired recursively.
+    """
+    if not isinstance(data, dict):
+        return data
+
+    repaired = dict(data)
+    for name, field in schema.model_fields.items():
+        annotation = field.annotation
+        origin = get_origin(annotation)
+        value = repaired.get(name)
+
+        if value is None:
+            if name == "reason":
+                repaired[name] = MISSING_REASON
+                stats.record("fill_default")
+            elif not field.is_required():
+                repaired[name] = field.get_default(call_default_factory=True)
+                stats.record("fill_default")
+            elif origin in (list, List):
+                repaired[name] = []
+                stats.record("fill_default")
+            continue
+
+        if origin in (list, List):
+            if not isinstance(value, list):
+                value = [value]
+                stats.record("wrap_list")
+            item_type = (get_args(annotation) or (Any,))[0]
+            if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+                value = [repair_payload(item, item_type, stats) for item in value]
+            repaired[name] = value
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            repaired[name] = repair_payload(value, annotation, stats)
+        elif annotation is int:
+            value = _coerce_number(value, stats)
+            repaired[name] = _clamp_score(value, stats) if name == "score" else value
+
+    return repaired
+
+
+def _replace_placeholder_reasons(model: BaseModel, stats: RepairStats) -> BaseModel:
+    """Replaces `reason` placeholders the parser filled in, nested models included"""
+    update = {}
+    for name, field in type(model).model_fields.items():
+        value = getattr(model, name)
+        if name == "reason" and value == field.default:
+            update[name] = MISSING_REASON
+            stats.record("fill_default")
+        elif isinstance(value, BaseModel):
+            replaced = _replace_placeholder_reasons(value, stats)
+            if replaced is not value:
+                update[name] = replaced
+    return model.model_copy(update=update) if update else model
+
+
+class StructuredOutputRepairer:
+    """
+    Final step of a structured output chain built with `include_raw=True`.
+
+    Returns the parsed model when parsing succeeded (with scores clamped to 0-100) and
+    otherwise tries to repair the raw response locally. Only when that fails does it
+    raise an OutputParserException, on which the stage chain asks once more, on the
+    fallback model or else on the same model.
+    """
+
+    def __init__(self, schema: Type[BaseModel], stats: RepairStats):
+        self.schema = schema
+        self.stats = stats
+
+    def __call__(self, output: Dict) -> BaseModel:
+        parsed = output.get("parsed")
+        if parsed is not None:
+            update = {}
+            score = getattr(parsed, "score", None)
+            clamped = _clamp_score(score, self.stats)
+            if clamped != score:
+                update["score"] = clamped
+            parsed = parsed.model_copy(update=update) if update else parsed
+            return _replace_placeholder_reasons(parsed, self.stats)
+
+        payload = extract_payload(output.get("raw"), self.stats)
+        if payload is None:
+            self.stats.record("unrepairable")
+            raise OutputParserException(
+                f"No structured {self.schema.__name__} response to repair"
+            ) from output.get("parsing_error")
+
+        try:
+            result = self.schema.model_validate(
+                repair_payload(payload, self.schema, self.stats)
+            )
+        except ValidationError as exc:
+            self.stats.record("unrepairable")
+            raise OutputParserException(
+                f"Could not repair {self.schema.__name__} response: {exc}"
+            ) from exc
+
+        self.stats.record("recovered")
+        return result
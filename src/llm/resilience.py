@@ -0,0 +1,248 @@
+import contextvars
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+# HTTP status codes worth retrying: request timeouts, rate limits and server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a stage does not finish within its deadline"""
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when the circuit breaker is open and calls fail fast"""
+
+
+@dataclass(frozen=True)
+class StagePolicy:
+    """
+    Latency controls applied to a single pipeline stage.
+
+    Attributes:
+        deadline: Seconds the stage may take in total, retries included. None disables it.
+        hedge_after: Seconds after which a duplicate request is sent if the first one
+            has not returned yet. None disables hedging.
+        max_retries: Number of retries after the first failed attempt.
+        backoff_base: Base delay in seconds for exponential backoff.
+        backoff_max: Upper bound for a single backoff delay in seconds.
+    """
+
+    deadline: Optional[float] = None
+    hedge_after: Optional[float] = None
+    max_retries: int = 2
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+
+
+def backoff_delay(attempt: int, policy: StagePolicy) -> float:
+    """Exponential backoff with full jitter for the given retry attempt"""
+    ceiling = min(policy.backoff_max, policy.backoff_base * (2**attempt))
+    return random.uniform(0, ceiling)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """
+    Whether `exc` is a provider or transport failure that a retry may fix: a timeout,
+    a connection error or an HTTP 408, 429 or 5xx response.
+
+    Anything else, such as output that cannot be parsed, a rejected request or a
+    programming error, fails the same way on every attempt.
+    """
+    # google.api_core errors carry the HTTP status as `code`, requests and httpx
+    # errors on their response
+    status = getattr(exc, "code", None)
+    if not isinstance(status, int):
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status in RETRYABLE_STATUS_CODES
+    # Timeouts, and connection errors including requests' transport errors
+    return isinstance(exc, OSError)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls fail fast
+    for `reset_timeout` seconds. After that a single probe call is let through; its
+    outcome closes the circuit again or re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Returns whether a call may be attempted right now"""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = "half_open"
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def record_ignored(self):
+        """Ends a call whose outcome says nothing about the provider's health"""
+        with self._lock:
+            if self.state == "half_open":
+                self._probe_in_flight = False
+
+
+class ResilientInvoker:
+    """
+    Invokes LangChain runnables under per-stage deadlines, optional hedging,
+    exponential backoff with jitter and a shared circuit breaker.
+
+    Only transient failures are retried and counted by the breaker; other errors are
+    raised on the first attempt.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, StagePolicy]] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        default_policy: StagePolicy = StagePolicy(),
+        max_workers: int = 32,
+        is_retryable: Callable[[BaseException], bool] = is_transient,
+    ):
+        """
+        Args:
+            policies: Mapping of stage name to its StagePolicy.
+            breaker: Circuit breaker shared by all stages. A new one is created if omitted.
+            default_policy: Policy used for stages missing from `policies`.
+            max_workers: Size of the thread pool used for deadline-bound and hedged calls.
+            is_retryable: Predicate selecting the errors that are retried and counted
+                as provider failures.
+        """
+        self.policies = policies or {}
+        self.breaker = breaker or CircuitBreaker()
+        self.default_policy = default_policy
+        self.is_retryable = is_retryable
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="llm-call"
+        )
+
+    def invoke(self, stage: str, runnable, inputs: Dict, config: Optional[Dict] = None):
+        """
+        Invokes `runnable` with `inputs` following the policy configured for `stage`.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open.
+            DeadlineExceeded: If the stage deadline passes before a successful response.
+        """
+        policy = self.policies.get(stage, self.default_policy)
+        deadline_at = (
+            time.monotonic() + policy.deadline if policy.deadline is not None else None
+        )
+
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                raise CircuitOpenError(
+                    f"Circuit open, failing fast for stage '{stage}'"
+                )
+            try:
+                result = self._attempt(runnable, inputs, config, policy, deadline_at)
+            except DeadlineExceeded:
+                self.breaker.record_failure()
+                raise
+            except Exception as exc:
+                if not self.is_retryable(exc):
+                    self.breaker.record_ignored()
+                    raise
+                self.breaker.record_failure()
+                if attempt >= policy.max_retries:
+                    raise
+                delay = backoff_delay(attempt, policy)
+                if deadline_at is not None and time.monotonic() + delay >= deadline_at:
+                    raise DeadlineExceeded(
+                        f"Stage '{stage}' ran out of time while retrying"
+                    ) from exc
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            self.breaker.record_success()
+            return result
+
+    def _submit(self, runnable, inputs: Dict, config: Optional[Dict]):
+        # Copy the context so LangChain callbacks and tracing follow the call
+        ctx = contextvars.copy_context()
+        return self._executor.submit(ctx.run, runnable.invoke, inputs, config)
+
+    def _attempt(
+        self,
+        runnable,
+        inputs: Dict,
+        config: Optional[Dict],
+        policy: StagePolicy,
+        deadline_at: Optional[float],
+    ) -> Any:
+        if deadline_at is None and policy.hedge_after is None:
+            return runnable.invoke(inputs, config)
+
+        def remaining():
+            if deadline_at is None:
+                return None
+            return max(0.0, deadline_at - time.monotonic())
+
+        pending = {self._submit(runnable, inputs, config)}
+        hedged = policy.hedge_after is None
+        first_error = None
+
+        while pending:
+            timeout = remaining()
+            if not hedged:
+                timeout = (
+                    policy.hedge_after
+                    if timeout is None
+                    else min(timeout, policy.hedge_after)
+                )
+
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+                first_error = first_error or future.exception()
+
+            if not done:
+                if not hedged and (deadline_at is None or remaining() > 0):
+                    pending.add(self._submit(runnable, inputs, config))
+                    hedged = True
+                    continue
+                raise DeadlineExceeded("Stage deadline exceeded")
+
+        raise first_error
@@ -0,0 +1,63 @@
+from typing import Any, Dict, List, Optional
+
+
+class LLMRouter:
+    """
+    Maps each pipeline stage to its own chat model.
+
+    Stages without an explicit model use `default`. When `fallback` is set, stages listed
+    in `fallback_stages` (all stages if None) retry on the fallback model when the
+    primary model's structured output fails validation.
+    """
+
+    def __init__(
+        self,
+        stage_llms: Optional[Dict[str, Any]] = None,
+        default: Any = None,
+        fallback: Any = None,
+        fallback_stages: Optional[set] = None,
+    ):
+        """
+        Args:
+            stage_llms: Mapping of stage name to the chat model serving it.
+            default: Chat model used for stages missing from `stage_llms`.
+            fallback: Stronger chat model used when validation fails on the primary one.
+            fallback_stages: Stages allowed to fall back. None allows every stage.
+        """
+        self.stage_llms = stage_llms or {}
+        self.default = default
+        self.fallback = fallback
+        self.fallback_stages = fallback_stages
+
+    @classmethod
+    def single(cls, llm):
+        """Returns a router sending every stage to the same chat model"""
+        return cls(default=llm)
+
+    def for_stage(self, stage: Optional[str]):
+        """Returns the chat model serving the given stage"""
+        llm = self.stage_llms.get(stage, self.default)
+        if llm is None:
+            raise ValueError(f"No model configured for stage '{stage}'")
+        return llm
+
+    def models(self) -> List[Any]:
+        """Returns every distinct chat model of the router"""
+        models = []
+        for llm in [*self.stage_llms.values(), self.default, self.fallback]:
+            if llm is not None and all(llm is not other for other in models):
+                models.append(llm)
+        return models
+
+    def fallback_for(self, stage: Optional[str]):
+        """
+        Returns the fallback chat model for the given stage, or None if the stage has no
+        fallback or is already served by the fallback model.
+        """
+        if self.fallback is None:
+            return None
+        if self.fallback_stages is not None and stage not in self.fallback_stages:
+            return None
+        if self.for_stage(stage) is self.fallback:
+            return None
+        return self.fallback
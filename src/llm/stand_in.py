@@ -0,0 +1,273 @@
+import json
+import os
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from langchain_core.messages import AIMessage
+from langchain_core.prompt_values import StringPromptValue
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel, ValidationError
+
+from .batch import gemini_schema, read_jsonl, write_jsonl
+
+
+class StandInError(RuntimeError):
+    """Failure injected by the StandInLLM, emulating a provider error"""
+
+    # Reported as a 503 so the invoker treats it like a transient provider error
+    code = 503
+
+
+def synthesize_from_schema(schema: Dict, root: Optional[Dict] = None, name: str = ""):
+    """
+    Builds a placeholder value that satisfies a JSON schema.
+
+    Args:
+        schema: The (sub-)schema to synthesize a value for.
+        root: The root schema used to resolve `$ref` entries.
+        name: The property name, used to pick plausible values (e.g. scores).
+
+    Returns:
+        A JSON-compatible value matching the schema.
+    """
+    root = root or schema
+    if "$ref" in schema:
+        ref = schema["$ref"].split("/")[-1]
+        return synthesize_from_schema(root["$defs"][ref], root, name)
+    if "anyOf" in schema:
+        return synthesize_from_schema(schema["anyOf"][0], root, name)
+
+    kind = str(schema.get("type", "object")).lower()
+    if kind == "object":
+        return {
+            key: synthesize_from_schema(value, root, key)
+            for key, value in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return [synthesize_from_schema(schema.get("items", {}), root, name)]
+    if kind in ("integer", "number"):
+        return 75 if "score" in name else 3
+    if kind == "boolean":
+        return True
+    return f"stand-in {name}".strip()
+
+
+def prefix_reuse(prompts: List[Tuple[str, str]]) -> Dict[str, float]:
+    """
+    Measures how much of each prompt repeats the start of an earlier prompt.
+
+    Args:
+        prompts: (stage or schema name, rendered prompt text) pairs in call order.
+
+    Returns:
+        For every name, the mean fraction of a prompt's characters covered by its longest
+        common prefix with an earlier prompt of the same name (first prompts excluded).
+    """
+    seen: Dict[str, List[str]] = {}
+    ratios: Dict[str, List[float]] = {}
+    for name, text in prompts:
+        previous = seen.setdefault(name, [])
+        if previous and text:
+            shared = max(len(os.path.commonprefix([text, other])) for other in previous)
+            ratios.setdefault(name, []).append(shared / len(text))
+        previous.append(text)
+    return {name: sum(values) / len(values) for name, values in ratios.items()}
+
+
+class StandInLLM:
+    """
+    Local stand-in for the chat model, used to exercise the pipeline without a provider.
+
+    It answers `with_structured_output` chains with schema-shaped instances of the
+    requested Pydantic class after an injected delay, and can inject slow calls and
+    failures to reproduce tail-latency behaviour. Rendered prompts can be recorded to
+    measure prefix reuse, explicit context caches can be emulated, and batch request
+    files can be answered with response files.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_latency: float = 5.0,
+        failure_rate: float = 0.0,
+        responses: Optional[Dict[Type[BaseModel], Callable]] = None,
+        seed: Optional[int] = None,
+        record_prompts: bool = False,
+        context_caching: bool = False,
+    ):
+        """
+        Args:
+            latency: Delay in seconds of a regular call.
+            slow_rate: Probability that a call takes `slow_latency` seconds instead.
+            slow_latency: Delay in seconds of a slow call.
+            failure_rate: Probability that a call raises a StandInError.
+            responses: Optional mapping of Pydantic class to a callable receiving the
+                prompt value and returning an instance (or dict) of that class.
+            seed: Seed for the random generator driving the injected behaviour.
+            record_prompts: Whether to keep (schema name, prompt text) of every call
+                in `prompts`.
+            context_caching: Whether to emulate `create_cached_content` and
+                `bind(cached_content=...)` of ChatGoogleGenerativeAI.
+        """
+        self.latency = latency
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.failure_rate = failure_rate
+        self.responses = responses or {}
+        self.record_prompts = record_prompts
+        self.calls = 0
+        self.cached_calls = 0
+        self.prompts: List[Tuple[str, str]] = []
+        self._caches: Dict[str, Tuple[Type[BaseModel], str]] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        if context_caching:
+            self.create_cached_content = self._create_cached_content
+
+    def with_structured_output(
+        self, schema: Type[BaseModel], include_raw: bool = False, **kwargs
+    ):
+        return RunnableLambda(lambda prompt: self._respond(schema, prompt, include_raw))
+
+    def bind(self, cached_content: str, **kwargs):
+        schema, prefix = self._caches[cached_content]
+        return RunnableLambda(
+            lambda prompt: self._respond_cached(schema, prefix, prompt)
+        )
+
+    def _create_cached_content(self, messages, tools, tool_choice=None, ttl=None):
+        with self._lock:
+            name = f"cachedContents/stand-in-{len(self._caches)}"
+            prefix = "\n".join(str(message.content) for message in messages)
+            self._caches[name] = (tools[0], prefix)
+        return name
+
+    def respond_to_batch(self, request_path, response_path):
+        """
+        Answers a Gemini batch request file with a response file.
+
+        Requests whose response schema matches a class in `responses` are answered by
+        its callable, the others with values synthesized from the schema. Injected
+        failures become error lines.
+        """
+        lines = []
+        for line in read_jsonl(request_path):
+            request = line["request"]
+            text = "\n".join(
+                part["text"]
+                for content in [request.get("system_instruction", {})]
+                + request["contents"]
+                for part in content.get("parts", [])
+            )
+            response_schema = request["generation_config"]["response_schema"]
+            schema = next(
+                (
+                    cls
+                    for cls in self.responses
+                    if gemini_schema(cls.model_json_schema()) == response_schema
+                ),
+                None,
+            )
+            try:
+                if schema is not None:
+                    payload = self._payload(schema, StringPromptValue(text=text), text)
+                else:
+                    self._draw(line["key"].rsplit("-", 1)[0], text)
+                    payload = synthesize_from_schema(response_schema)
+            except StandInError as exc:
+                lines.append(
+                    {"key": line["key"], "error": {"code": 503, "message": str(exc)}}
+                )
+                continue
+
+            output = json.dumps(payload, default=str)
+            lines.append(
+                {
+                    "key": line["key"],
+                    "response": {
+                        "candidates": [
+                            {
+                                "content": {
+                                    "role": "model",
+                                    "parts": [{"text": output}],
+                                },
+                                "finishReason": "STOP",
+                            }
+                        ],
+                        "usageMetadata": {
+                            "promptTokenCount": len(text) // 4,
+                            "candidatesTokenCount": len(output) // 4,
+                            "totalTokenCount": (len(text) + len(output)) // 4,
+                        },
+                    },
+                }
+            )
+        write_jsonl(response_path, lines)
+
+    def _draw(self, name: str, text: str):
+        """Counts a call and applies the injected delay and failure"""
+        with self._lock:
+            self.calls += 1
+            if self.record_prompts:
+                self.prompts.append((name, text))
+            slow = self._random.random() < self.slow_rate
+            failed = self._random.random() < self.failure_rate
+
+        time.sleep(self.slow_latency if slow else self.latency)
+        if failed:
+            raise StandInError("Injected stand-in failure")
+
+    def _payload(self, schema: Type[BaseModel], prompt, text: str) -> Dict:
+        self._draw(schema.__name__, text)
+
+        if schema in self.responses:
+            payload = self.responses[schema](prompt)
+        else:
+            payload = synthesize_from_schema(schema.model_json_schema())
+        if isinstance(payload, BaseModel):
+            payload = payload.model_dump()
+        return payload
+
+    def _respond(self, schema: Type[BaseModel], prompt, include_raw: bool = False):
+        text = prompt.to_string()
+        payload = self._payload(schema, prompt, text)
+        if not include_raw:
+            return schema.model_validate(payload)
+
+        # Mirror with_structured_output(include_raw=True) of the real chat models
+        raw = self._tool_call_message(schema, payload, text)
+        try:
+            return {
+                "raw": raw,
+                "parsed": schema.model_validate(payload),
+                "parsing_error": None,
+            }
+        except ValidationError as exc:
+            return {"raw": raw, "parsed": None, "parsing_error": exc}
+
+    def _respond_cached(self, schema: Type[BaseModel], prefix: str, prompt):
+        with self._lock:
+            self.cached_calls += 1
+        text = prefix + "\n" + prompt.to_string()
+        payload = self._payload(schema, prompt, text)
+        return self._tool_call_message(schema, payload, text)
+
+    @staticmethod
+    def _tool_call_message(
+        schema: Type[BaseModel], payload: Dict, prompt_text: str = ""
+    ) -> AIMessage:
+        # Token counts estimated at 4 characters per token
+        input_tokens = len(prompt_text) // 4
+        output_tokens = len(json.dumps(payload, default=str)) // 4
+        return AIMessage(
+            content="",
+            tool_calls=[{"name": schema.__name__, "args": payload, "id": "stand-in"}],
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
@@ -0,0 +1,186 @@
+from collections.abc import Mapping
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+
+from .candidate import CandidateProfile
+from .job import JobRequirements
+from .scores import (
+    SkillScore,
+    ExperienceScore,
+    EducationScore,
+    OtherScore,
+    Recommendations,
+)
+
+
+class AnalysisResult(Mapping):
+    """
+    Analysis of a single resume against a job description.
+
+    Keeps references to the Pydantic models produced by the pipeline instead of copying
+    them into nested dicts. The dict view expected by the app (`name`, `total_score`,
+    `component_scores`, `analysis`, `recommendations`) is built lazily, once, on first
+    access, and `to_json` serializes it with orjson.
+    """
+
+    __slots__ = (
+        "candidate",
+        "skills",
+        "experience",
+        "education",
+        "other",
+        "recommendations_response",
+        "weights",
+        "_view",
+    )
+
+    KEYS = ("name", "total_score", "component_scores", "analysis", "recommendations")
+
+    def __init__(
+        self,
+        candidate: CandidateProfile,
+        skills: SkillScore,
+        experience: ExperienceScore,
+        education: EducationScore,
+        other: OtherScore,
+        recommendations: Optional[Recommendations],
+        weights: Dict[str, float],
+    ):
+        self.candidate = candidate
+        self.skills = skills
+        self.experience = experience
+        self.education = education
+        self.other = other
+        self.recommendations_response = recommendations
+        self.weights = weights
+        self._view = None
+
+    @property
+    def name(self) -> str:
+        return self.candidate.name
+
+    @property
+    def weighted_scores(self) -> Dict[str, float]:
+        """Component scores multiplied by their weights"""
+        return {
+            "skills": self.skills.score * self.weights["skills"],
+            "experience": self.experience.score * self.weights["experience"],
+            "education": self.education.score * self.weights["education"],
+            "other": self.other.score * self.weights["other"],
+        }
+
+    @property
+    def total_score(self) -> float:
+        return sum(self.weighted_scores.values())
+
+    @property
+    def recommendations(self) -> Optional[str]:
+        if self.recommendations_response is None:
+            return None
+        return self.recommendations_response.recommendations
+
+    def to_dict(self) -> Dict:
+        """Returns the nested dict view of the result, building it on first use"""
+        if self._view is None:
+            weighted = self.weighted_scores
+            self._view = {
+                "name": self.name,
+                "total_score": sum(weighted.values()),
+                "component_scores": {
+                    "skills": {
+                        "score": weighted["skills"],
+                        "reason": self.skills.reason,
+                    },
+                    "experience": {
+                        "score": weighted["experience"],
+                        "reason": self.experience.reason,
+                    },
+                    "education": {
+                        "score": weighted["education"],
+                        "reason": self.education.reason,
+                    },
+                    "other": {"score": weighted["other"], "reason": self.other.reason},
+                },
+                "analysis": {
+                    "matching_skills": self.candidate.skills,
+                    "experience_summary": self.candidate.experience.model_dump(),
+                    "education_summary": self.candidate.education.model_dump(),
+                    "other_factors": self.candidate.other_skills.model_dump(),
+                },
+                "recommendations": self.recommendations,
+            }
+        return self._view
+
+    def to_json(self) -> bytes:
+        """Serializes the dict view to JSON bytes"""
+        return orjson.dumps(self.to_dict())
+
+    def __getitem__(self, key: str):
+        return self.to_dict()[key]
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __repr__(self) -> str:
+        return f"AnalysisResult(name={self.name!r}, total_score={self.total_score:.1f})"
+
+
+class MatchMatrix:
+    """
+    Results of analyzing N resumes against M job descriptions.
+
+    `results[i][j]` is the AnalysisResult of candidate i against job j, or None when the
+    pair was skipped by the prefilter.
+    """
+
+    __slots__ = ("candidates", "jobs", "results")
+
+    def __init__(
+        self,
+        candidates: List[CandidateProfile],
+        jobs: List[JobRequirements],
+        results: List[List[Optional[AnalysisResult]]],
+    ):
+        self.candidates = candidates
+        self.jobs = jobs
+        self.results = results
+
+    @property
+    def scores(self) -> List[List[Optional[float]]]:
+        """Candidate-by-role matrix of total scores, None for skipped pairs"""
+        return [
+            [None if result is None else result.total_score for result in row]
+            for row in self.results
+        ]
+
+    def ranking(self, job_index: int) -> List[Tuple[int, float]]:
+        """Returns (candidate index, total score) pairs for a role, best first"""
+        ranked = [
+            (i, row[job_index].total_score)
+            for i, row in enumerate(self.results)
+            if row[job_index] is not None
+        ]
+        return sorted(ranked, key=lambda item: item[1], reverse=True)
+
+    def best_role(self, candidate_index: int) -> Optional[Tuple[int, float]]:
+        """Returns the (job index, total score) pair a candidate fits best, if any"""
+        scored = [
+            (j, result.total_score)
+            for j, result in enumerate(self.results[candidate_index])
+            if result is not None
+        ]
+        return max(scored, key=lambda item: item[1], default=None)
+
+    def to_json(self) -> bytes:
+        """Serializes the score matrix and per-role rankings to JSON bytes"""
+        return orjson.dumps(
+            {
+                "candidates": [candidate.name for candidate in self.candidates],
+                "scores": self.scores,
+                "rankings": [self.ranking(j) for j in range(len(self.jobs))],
+            }
+        )
@@ -41,3 +41,14 @@ class Recommendations(BaseModel):
     recommendations: str = Field(
         description="Recommendations for the candidate to improve in Markdown format"
     )
+
+
+class CandidateScores(BaseModel):
+    skills: SkillScore = Field(description="Skills comparison")
+    experience: ExperienceScore = Field(description="Experience comparison")
+    education: EducationScore = Field(
+        description="Education and certifications comparison"
+    )
+    other: OtherScore = Field(
+        description="Comparison of other factors (location, languages, soft skills)"
+    )
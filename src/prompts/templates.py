@@ -1,5 +1,10 @@
 from langchain_core.prompts import ChatPromptTemplate
 
+# Prompt layout: the system message, the instructions and the job description side form
+# a prefix that is identical for every candidate screened against the same job, and the
+# candidate payload comes last in its own message. This lets the provider reuse the
+# cached prefix across candidates.
+
 resume_user_template = """
 Analyze the following resume and extract key components.
 
@@ -61,13 +66,14 @@ Compare these skill sets and rate the match from 0-100:
 3. **Industry-standard Alternatives**:
 - Take into account industry-standard terms or synonymous skills. For instance, "Cloud Computing" might appear as "AWS" in the resume or job description.
 
-- **Resume Skills**:
-{resume_skills}
+Provide a score from 0 to 100 reflecting the overall match. If the candidate is only missing a few specific but crucial skills or has alternative terms, rate it higher within the range. If there are significant mismatches or missing essential skills, rate it lower.
 
 - **Required Skills**:
 {required_skills}
-
-Provide a score from 0 to 100 reflecting the overall match. If the candidate is only missing a few specific but crucial skills or has alternative terms, rate it higher within the range. If there are significant mismatches or missing essential skills, rate it lower.
+"""
+skills_candidate_template = """
+- **Resume Skills**:
+{resume_skills}
 """
 skills_score_prompt_template = ChatPromptTemplate(
     [
@@ -80,6 +86,7 @@ skills_score_prompt_template = ChatPromptTemplate(
             "user",
             skills_user_template,
         ),
+        ("user", skills_candidate_template),
     ]
 )
 
@@ -97,13 +104,14 @@ Compare the experience and rate the match from 0-100:
 3. **Levels**:
 - Consider the role level in the resume (e.g., Full-time) and compare it to the job's level requirement (e.g., Mid-level). If the candidate has relevant experience at a similar level, even if not explicitly stated, adjust the match accordingly.
 
-- **Resume Information**:
-{resume_exp}
+Provide a score from 0 to 100 reflecting the overall match. If the experience is close but not quite matching the requirements (e.g., a few months short or some domain differences), rate it higher within the range. If there are notable discrepancies (e.g., large differences in experience or completely mismatched domains), rate it lower.
 
 - **Job Description**:
 {required_exp}
-
-Provide a score from 0 to 100 reflecting the overall match. If the experience is close but not quite matching the requirements (e.g., a few months short or some domain differences), rate it higher within the range. If there are notable discrepancies (e.g., large differences in experience or completely mismatched domains), rate it lower.
+"""
+experience_candidate_template = """
+- **Resume Information**:
+{resume_exp}
 """
 experience_score_prompt_template = ChatPromptTemplate(
     [
@@ -116,6 +124,7 @@ experience_score_prompt_template = ChatPromptTemplate(
             "user",
             experience_user_template,
         ),
+        ("user", experience_candidate_template),
     ]
 )
 
@@ -134,13 +143,14 @@ Compare education and certifications and rate the match from 0-100:
 4. **Additional Relevant Certifications**:
 - Consider any additional certifications listed in the resume that, while not required, could be highly relevant or beneficial for the job.
 
-- **Resume Education and Certifications**:
-{resume_edu}
+Provide a score from 0 to 100 reflecting the overall match. If the candidate has a degree close to the required level or a similar field of study, or if alternative certifications are highly relevant, adjust the score upwards. If there are major discrepancies, rate it lower.
 
 - **Required Education and Certifications**:
 {required_edu}
-
-Provide a score from 0 to 100 reflecting the overall match. If the candidate has a degree close to the required level or a similar field of study, or if alternative certifications are highly relevant, adjust the score upwards. If there are major discrepancies, rate it lower.
+"""
+education_candidate_template = """
+- **Resume Education and Certifications**:
+{resume_edu}
 """
 education_score_prompt_template = ChatPromptTemplate(
     [
@@ -153,6 +163,7 @@ education_score_prompt_template = ChatPromptTemplate(
             "user",
             education_user_template,
         ),
+        ("user", education_candidate_template),
     ]
 )
 
@@ -171,13 +182,14 @@ Compare other factors and rate the match from 0-100:
 4. **Any Other Specified Requirements**:
 - Take into account any additional factors mentioned in the resume or job description, such as willingness to travel, remote work preferences, or specific tools/technologies that could impact the candidate's fit for the role.
 
-- **Resume Other Factors**:
-{resume_other}
+Provide a score from 0 to 100 reflecting the overall match. If the candidate meets or is close to meeting the location, language, or soft skill requirements, rate the match higher. If there are clear mismatches or missing key factors, rate it lower.
 
 - **Required Other Factors**:
 {required_other}
-
-Provide a score from 0 to 100 reflecting the overall match. If the candidate meets or is close to meeting the location, language, or soft skill requirements, rate the match higher. If there are clear mismatches or missing key factors, rate it lower.
+"""
+others_candidate_template = """
+- **Resume Other Factors**:
+{resume_other}
 """
 other_score_prompt_template = ChatPromptTemplate(
     [
@@ -190,6 +202,7 @@ other_score_prompt_template = ChatPromptTemplate(
             "user",
             others_user_template,
         ),
+        ("user", others_candidate_template),
     ]
 )
 
@@ -198,20 +211,6 @@ recommendations_user_template = """
 Given the following job description, along with the candidate's skill and experience scores, please generate a detailed list of recommendations for the candidate to improve upon in order to match the job requirements more closely. The recommendations should focus on closing gaps in both skills and experience, and should suggest actionable steps for improvement. 
 Provide specific suggestions for acquiring missing skills or gaining relevant experience.
 
-Job Description:
-{jd_text}
-
-Skills:
-- Matching Skills: {matching_skills}
-- Missing Skills: {missing_skills}
-
-Experience:
-- Candidate Experience: 
-{candidate_experience}
-
-- Required Experience: 
-{required_experience}
-
 Please include:
 - Specific skills the candidate should focus on acquiring.
 - Recommended courses, certifications, or resources for learning missing skills.
@@ -223,6 +222,21 @@ Your response should be actionable, clear, and tailored to the gaps identified i
 Provide the response in Markdown format. 
 
 DO NOT USE MAIN HEADING LIKE #, ##, ###
+
+Job Description:
+{jd_text}
+
+- Required Experience: 
+{required_experience}
+"""
+recommendations_candidate_template = """
+Skills:
+- Matching Skills: {matching_skills}
+- Missing Skills: {missing_skills}
+
+Experience:
+- Candidate Experience: 
+{candidate_experience}
 """
 recommendations_prompt_template = ChatPromptTemplate(
     [
@@ -236,5 +250,57 @@ recommendations_prompt_template = ChatPromptTemplate(
             "user",
             recommendations_user_template,
         ),
+        ("user", recommendations_candidate_template),
+    ]
+)
+
+
+fused_user_template = """
+Compare the candidate against the job requirements and rate each section from 0-100:
+
+1. **Skills**: exact matches weigh most, then related skills and industry-standard alternatives. List the matching and missing skills.
+2. **Experience**: relevant years of experience, domains and role levels. Experience in unrelated roles is penalized.
+3. **Education**: degree level, field of study and required certifications. Close or relevant alternatives get partial credit.
+4. **Other**: location, language requirements, soft skills and any other stated requirement.
+
+For every section, rate higher when the candidate meets or is close to the requirement and lower for clear mismatches, and give a short reason.
+
+- **Required Skills**:
+{required_skills}
+
+- **Required Experience**:
+{required_exp}
+
+- **Required Education and Certifications**:
+{required_edu}
+
+- **Required Other Factors**:
+{required_other}
+"""
+fused_candidate_template = """
+- **Resume Skills**:
+{resume_skills}
+
+- **Resume Experience**:
+{resume_exp}
+
+- **Resume Education and Certifications**:
+{resume_edu}
+
+- **Resume Other Factors**:
+{resume_other}
+"""
+fused_score_prompt_template = ChatPromptTemplate(
+    [
+        (
+            "system",
+            "You are tasked with comparing a candidate's resume with a job's requirements section by section: \
+    skills, experience, education and other factors. Your goal is to evaluate how closely each section matches on a scale from 0 to 100.",
+        ),
+        (
+            "user",
+            fused_user_template,
+        ),
+        ("user", fused_candidate_template),
     ]
 )
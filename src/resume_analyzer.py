@@ -1,14 +1,18 @@
+import hashlib
 import json
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
 
 from .models.candidate import CandidateProfile
 from .models.job import JobRequirements
+from .models.result import AnalysisResult, MatchMatrix
 from .models.scores import (
     SkillScore,
     ExperienceScore,
     EducationScore,
     OtherScore,
     Recommendations,
+    CandidateScores,
 )
 
 from .prompts.templates import (
@@ -19,20 +23,90 @@ from .prompts.templates import (
     education_score_prompt_template,
     other_score_prompt_template,
     recommendations_prompt_template,
+    fused_score_prompt_template,
 )
 
+from .llm.budget import FULL, FUSED_SCORING, STOP, TokenBudget, usage_meter
+from .llm.context_cache import ContextCacheRegistry, tool_call_output
+from .llm.repair import RepairStats, StructuredOutputRepairer
+from .llm.router import LLMRouter
+from .llm.llm_config import (
+    get_invoker,
+    RESUME_EXTRACTION,
+    JD_EXTRACTION,
+    SKILLS_SCORE,
+    EXPERIENCE_SCORE,
+    EDUCATION_SCORE,
+    OTHER_SCORE,
+    RECOMMENDATIONS,
+    FUSED_SCORE,
+)
 from .utils.pdf_loader import get_current_date
+from .utils.rule_scorer import RuleScorer
+from .utils.singleflight import SingleFlight
+from .utils.stage_cache import LRUCache, StageCache
 
+from langchain_core.exceptions import OutputParserException
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
+from pydantic import ValidationError
+
+# Output class and prompt template of every stage
+STAGE_SPECS = {
+    RESUME_EXTRACTION: (CandidateProfile, resume_extract_prompt_template),
+    JD_EXTRACTION: (JobRequirements, jd_extract_prompt_template),
+    SKILLS_SCORE: (SkillScore, skills_score_prompt_template),
+    EXPERIENCE_SCORE: (ExperienceScore, experience_score_prompt_template),
+    EDUCATION_SCORE: (EducationScore, education_score_prompt_template),
+    OTHER_SCORE: (OtherScore, other_score_prompt_template),
+    RECOMMENDATIONS: (Recommendations, recommendations_prompt_template),
+    FUSED_SCORE: (CandidateScores, fused_score_prompt_template),
+}
+
+# Stage chains kept per system; chains bound to a provider context cache are kept per
+# job description, so the registry is bounded
+CHAIN_REGISTRY_SIZE = 256
 
 
 class ResumeAnalysisSystem:
 
-    def __init__(self, llm):
+    def __init__(
+        self,
+        llm,
+        invoker=None,
+        score_cache_size: int = 1024,
+        context_cache: Optional[ContextCacheRegistry] = None,
+        rule_scoring: bool = True,
+    ):
         """
         Initializes the ResumeAnalysisSystem with a Large Language Model (LLM) object.
+
+        Args:
+            llm: The LangChain chat model used for every stage, or an LLMRouter
+                serving each stage with its own model.
+            invoker: A ResilientInvoker applying per-stage deadlines, hedging, retries and
+                circuit breaking. Defaults to the policies configured in llm_config.
+            score_cache_size: Entries kept per scoring stage in the LRU cache shared across
+                candidates. Identical section comparisons against the same job description
+                are answered from the cache. 0 disables it.
+            context_cache: Optional ContextCacheRegistry creating an explicit provider
+                context cache per job description for the stages whose prompts start
+                with the job description side.
+            rule_scoring: Whether experience, education and other factors are scored
+                by deterministic rules when the comparison is clear-cut, calling the LLM
+                only for ambiguous cases.
         """
         self.llm = llm
+        self.router = llm if isinstance(llm, LLMRouter) else LLMRouter.single(llm)
+        self.invoker = invoker or get_invoker()
+        self.stage_cache = StageCache(score_cache_size)
+        # Identical analyses and extractions running at the same time (e.g. the same
+        # resume uploaded in two sessions) share one computation
+        self.inflight = SingleFlight()
+        self.repair_stats = RepairStats()
+        self.context_cache = context_cache
+        self.rule_scorer = RuleScorer() if rule_scoring else None
+        self.chains = LRUCache(CHAIN_REGISTRY_SIZE)
         self.weights = {
             "skills": 0.4,
             "experience": 0.3,
@@ -41,22 +115,148 @@ class ResumeAnalysisSystem:
         }
         self.results = []
 
-    def get_structured_llm_chain(self, structured_class, prompt_template):
+    def get_structured_llm_chain(
+        self, structured_class, prompt_template, stage=None, prefix_inputs=None
+    ):
         """
         Creates a Runnable Chain.
 
         Args:
             structured_class: The Pydantic class representing the desired structured output.
             prompt_template: The template prompt for the LLM chain.
+            stage: The pipeline stage, used to pick the model serving the chain.
+            prefix_inputs: The job description side inputs of the prompt. When given and
+                a context cache is configured, every message but the last (the candidate
+                payload) is served from an explicit provider cache, created on the first
+                call of each model and renewed when it expires.
 
         Returns:
-            A Langchain object representing the LLM prompt chain.
+            A Langchain object representing the LLM prompt chain. The token usage of
+            every response is charged to the active TokenBudget, if any. Responses failing
+            validation are repaired locally first; if that fails the chain retries once,
+            on the router's fallback model for the stage or else on the same model.
+        """
+        repairer = StructuredOutputRepairer(structured_class, self.repair_stats)
+        meter = usage_meter(stage)
+
+        def build(llm):
+            structured_llm = llm.with_structured_output(
+                structured_class, include_raw=True
+            )
+            uncached = (
+                prompt_template
+                | structured_llm
+                | RunnableLambda(meter)
+                | RunnableLambda(repairer)
+            )
+            if self.context_cache is None or prefix_inputs is None:
+                return uncached
+
+            prefix = ChatPromptTemplate(prompt_template.messages[:-1])
+            prefix_messages = prefix.format_messages(**prefix_inputs)
+            candidate_prompt = ChatPromptTemplate(prompt_template.messages[-1:])
+
+            def call(inputs, config):
+                # Resolved per call, so the cache is only created once the model is
+                # actually called and is re-created when it expires
+                handle = self.context_cache.handle_for(
+                    llm, stage, prefix_messages, structured_class
+                )
+                if handle is None:
+                    return uncached.invoke(inputs, config)
+                cached = (
+                    candidate_prompt
+                    | llm.bind(cached_content=handle)
+                    | RunnableLambda(tool_call_output(structured_class))
+                    | RunnableLambda(meter)
+                    | RunnableLambda(repairer)
+                )
+                try:
+                    return cached.invoke(inputs, config)
+                except Exception as exc:
+                    # The provider no longer knows the cache (403/404); send the full
+                    # prompt and create a new cache on the next call
+                    if getattr(exc, "code", None) not in (403, 404):
+                        raise
+                    self.context_cache.invalidate(handle)
+                    return uncached.invoke(inputs, config)
+
+            return RunnableLambda(call)
+
+        llm = self.router.for_stage(stage)
+        # Without a distinct fallback model the primary one is asked once more. The
+        # invoker does not retry parse failures, as they are not provider errors.
+        fallback_llm = self.router.fallback_for(stage) or llm
+        return build(llm).with_fallbacks(
+            [build(fallback_llm)],
+            exceptions_to_handle=(OutputParserException, ValidationError),
+        )
+
+    def stage_chain(self, stage: str, prefix_inputs: Optional[Dict] = None):
         """
+        Returns the compiled chain of a stage, building it on first use.
+
+        Chains are built once per system and reused by every call. With a context
+        cache configured, the chain depends on the cached prefix and is kept per
+        `prefix_inputs`.
 
-        structured_llm = self.llm.with_structured_output(structured_class)
-        chain = prompt_template | structured_llm
+        Args:
+            stage: The pipeline stage name.
+            prefix_inputs: The job description side inputs of the stage prompt.
+        """
+        key = stage
+        if self.context_cache is not None and prefix_inputs is not None:
+            prefix = json.dumps(prefix_inputs, sort_keys=True).encode("utf-8")
+            key = f"{stage}:{hashlib.sha256(prefix).hexdigest()}"
+
+        chain = self.chains.get(key)
+        if chain is None:
+            structured_class, prompt_template = STAGE_SPECS[stage]
+            chain = self.get_structured_llm_chain(
+                structured_class, prompt_template, stage, prefix_inputs
+            )
+            self.chains.put(key, chain)
         return chain
 
+    def warm_up(self, timeout: float = 10.0) -> Dict[str, Optional[str]]:
+        """
+        Builds every stage chain and opens a connection on every distinct client.
+
+        Connections are opened with a token count request, which is not billed. Failures
+        are reported, not raised, so a provider hiccup does not block startup.
+
+        Args:
+            timeout: Seconds to wait for the connections before giving up on them.
+
+        Returns:
+            For every client model, None if it is warm or the error message.
+        """
+        for stage in STAGE_SPECS:
+            self.stage_chain(stage)
+
+        clients = [
+            llm for llm in self.router.models() if hasattr(llm, "get_num_tokens")
+        ]
+        if not clients:
+            return {}
+
+        executor = ThreadPoolExecutor(max_workers=len(clients))
+        futures = [executor.submit(llm.get_num_tokens, "warm-up") for llm in clients]
+        wait(futures, timeout=timeout)
+        # Do not wait for requests still hanging past the timeout
+        executor.shutdown(wait=False)
+
+        status = {}
+        for llm, future in zip(clients, futures):
+            if not future.done():
+                error = f"no response within {timeout}s"
+            elif future.exception() is not None:
+                error = str(future.exception())
+            else:
+                error = None
+            status[str(getattr(llm, "model", type(llm).__name__))] = error
+        return status
+
     def extract_resume_components(self, resume_text: str) -> CandidateProfile:
         """
         Extracts components (skills, experience, education, etc.) from a resume text using the LLM chain.
@@ -67,11 +267,14 @@ class ResumeAnalysisSystem:
         Returns:
             A CandidateProfile object containing extracted information.
         """
-        chain = self.get_structured_llm_chain(
-            CandidateProfile, resume_extract_prompt_template
-        )
-        return chain.invoke(
-            {"resume_text": resume_text, "current_date": get_current_date()}
+        chain = self.stage_chain(RESUME_EXTRACTION)
+        return self.inflight.do(
+            (RESUME_EXTRACTION, resume_text),
+            lambda: self.invoker.invoke(
+                RESUME_EXTRACTION,
+                chain,
+                {"resume_text": resume_text, "current_date": get_current_date()},
+            ),
         )
 
     def analyze_job_description(self, jd_text: str) -> JobRequirements:
@@ -84,10 +287,11 @@ class ResumeAnalysisSystem:
         Returns:
             A JobRequirements object containing extracted requirements.
         """
-        chain = self.get_structured_llm_chain(
-            JobRequirements, jd_extract_prompt_template
+        chain = self.stage_chain(JD_EXTRACTION)
+        return self.inflight.do(
+            (JD_EXTRACTION, jd_text),
+            lambda: self.invoker.invoke(JD_EXTRACTION, chain, {"jd_text": jd_text}),
         )
-        return chain.invoke({"jd_text": jd_text})
 
     def calculate_skills_score(
         self, resume_skills: List[str], required_skills: List[str]
@@ -102,9 +306,17 @@ class ResumeAnalysisSystem:
         Returns:
             A SkillScore object containing the score and reason.
         """
-        chain = self.get_structured_llm_chain(SkillScore, skills_score_prompt_template)
-        response = chain.invoke(
-            {"resume_skills": resume_skills, "required_skills": required_skills}
+        chain = self.stage_chain(
+            SKILLS_SCORE, prefix_inputs={"required_skills": required_skills}
+        )
+        response = self.stage_cache.get_or_compute(
+            SKILLS_SCORE,
+            (resume_skills, required_skills),
+            lambda: self.invoker.invoke(
+                SKILLS_SCORE,
+                chain,
+                {"resume_skills": resume_skills, "required_skills": required_skills},
+            ),
         )
 
         return response
@@ -122,14 +334,26 @@ class ResumeAnalysisSystem:
         Returns:
             An ExperienceScore object containing the score and reason.
         """
-        chain = self.get_structured_llm_chain(
-            ExperienceScore, experience_score_prompt_template
+        if self.rule_scorer is not None:
+            response = self.rule_scorer.score("experience", resume_exp, required_exp)
+            if response is not None:
+                return response
+
+        chain = self.stage_chain(
+            EXPERIENCE_SCORE,
+            prefix_inputs={"required_exp": json.dumps(required_exp)},
         )
-        response = chain.invoke(
-            {
-                "resume_exp": json.dumps(resume_exp),
-                "required_exp": json.dumps(required_exp),
-            }
+        response = self.stage_cache.get_or_compute(
+            EXPERIENCE_SCORE,
+            (resume_exp, required_exp),
+            lambda: self.invoker.invoke(
+                EXPERIENCE_SCORE,
+                chain,
+                {
+                    "resume_exp": json.dumps(resume_exp),
+                    "required_exp": json.dumps(required_exp),
+                },
+            ),
         )
 
         return response
@@ -147,14 +371,26 @@ class ResumeAnalysisSystem:
         Returns:
             An EducationScore object containing the score and reason.
         """
-        chain = self.get_structured_llm_chain(
-            EducationScore, education_score_prompt_template
+        if self.rule_scorer is not None:
+            response = self.rule_scorer.score("education", resume_edu, required_edu)
+            if response is not None:
+                return response
+
+        chain = self.stage_chain(
+            EDUCATION_SCORE,
+            prefix_inputs={"required_edu": json.dumps(required_edu)},
         )
-        response = chain.invoke(
-            {
-                "resume_edu": json.dumps(resume_edu),
-                "required_edu": json.dumps(required_edu),
-            }
+        response = self.stage_cache.get_or_compute(
+            EDUCATION_SCORE,
+            (resume_edu, required_edu),
+            lambda: self.invoker.invoke(
+                EDUCATION_SCORE,
+                chain,
+                {
+                    "resume_edu": json.dumps(resume_edu),
+                    "required_edu": json.dumps(required_edu),
+                },
+            ),
         )
 
         return response
@@ -172,12 +408,63 @@ class ResumeAnalysisSystem:
         Returns:
             An OtherScore object containing the score and reason.
         """
-        chain = self.get_structured_llm_chain(OtherScore, other_score_prompt_template)
-        response = chain.invoke(
-            {
-                "resume_other": json.dumps(resume_other),
-                "required_other": json.dumps(required_other),
-            }
+        if self.rule_scorer is not None:
+            response = self.rule_scorer.score("other", resume_other, required_other)
+            if response is not None:
+                return response
+
+        chain = self.stage_chain(
+            OTHER_SCORE,
+            prefix_inputs={"required_other": json.dumps(required_other)},
+        )
+        response = self.stage_cache.get_or_compute(
+            OTHER_SCORE,
+            (resume_other, required_other),
+            lambda: self.invoker.invoke(
+                OTHER_SCORE,
+                chain,
+                {
+                    "resume_other": json.dumps(resume_other),
+                    "required_other": json.dumps(required_other),
+                },
+            ),
+        )
+
+        return response
+
+    def calculate_fused_scores(
+        self, resume_components: CandidateProfile, jd_components: JobRequirements
+    ) -> CandidateScores:
+        """
+        Scores skills, experience, education and other factors in a single LLM call.
+
+        Cheaper than the four section scoring calls, at the cost of less detailed
+        instructions per section. Used when a token budget runs low.
+
+        Args:
+            resume_components: The CandidateProfile extracted from the resume.
+            jd_components: The JobRequirements extracted from the job description.
+
+        Returns:
+            A CandidateScores object with the four section scores and reasons.
+        """
+        required = {
+            "required_skills": jd_components.required_skills,
+            "required_exp": jd_components.required_experience.model_dump_json(),
+            "required_edu": jd_components.required_education.model_dump_json(),
+            "required_other": jd_components.other_requirements.model_dump_json(),
+        }
+        candidate = {
+            "resume_skills": resume_components.skills,
+            "resume_exp": resume_components.experience.model_dump_json(),
+            "resume_edu": resume_components.education.model_dump_json(),
+            "resume_other": resume_components.other_skills.model_dump_json(),
+        }
+        chain = self.stage_chain(FUSED_SCORE, prefix_inputs=required)
+        response = self.stage_cache.get_or_compute(
+            FUSED_SCORE,
+            (candidate, required),
+            lambda: self.invoker.invoke(FUSED_SCORE, chain, {**required, **candidate}),
         )
 
         return response
@@ -201,115 +488,275 @@ class ResumeAnalysisSystem:
         Returns:
             A Recommendations object containing the recommendations in Markdown format.
         """
-        chain = self.get_structured_llm_chain(
-            Recommendations, recommendations_prompt_template
-        )
+        jd_inputs = {
+            "jd_text": jd_text,
+            "required_experience": json.dumps(jd_experience),
+        }
+        chain = self.stage_chain(RECOMMENDATIONS, prefix_inputs=jd_inputs)
 
         matching_skills = resume_skills["matching_skills"]
         missing_skills = resume_skills["missing_skills"]
 
-        response = chain.invoke(
+        response = self.invoker.invoke(
+            RECOMMENDATIONS,
+            chain,
             {
-                "jd_text": {jd_text},
-                "matching_skills": {json.dumps(matching_skills)},
-                "missing_skills": {json.dumps(missing_skills)},
-                "candidate_experience": {json.dumps(resume_experience)},
-                "required_experience": {json.dumps(jd_experience)},
-            }
+                **jd_inputs,
+                "matching_skills": json.dumps(matching_skills),
+                "missing_skills": json.dumps(missing_skills),
+                "candidate_experience": json.dumps(resume_experience),
+            },
         )
 
         return response
 
-    def analyze_resume(self, resume_text: str, job_description: str) -> Dict:
+    def score_candidate(
+        self,
+        resume_components: CandidateProfile,
+        jd_components: JobRequirements,
+        job_description: str,
+        with_recommendations: bool = True,
+        fused: bool = False,
+    ) -> AnalysisResult:
         """
-        Analyzes a single resume against a job description and returns a comprehensive analysis result.
+        Scores already extracted resume components against extracted job requirements.
 
         Args:
-            resume_text: The text content of the resume.
+            resume_components: The CandidateProfile extracted from the resume.
+            jd_components: The JobRequirements extracted from the job description.
             job_description: The text content of the job description.
+            with_recommendations: Whether to generate recommendations for the candidate.
+            fused: Whether to score all sections in a single call instead of one call
+                per section.
 
         Returns:
-            A dictionary containing the analysis results, including scores, reasons, analysis summary, and recommendations.
+            An AnalysisResult for the candidate and job description pair.
         """
-
-        # Extract components
-        resume_components = self.extract_resume_components(resume_text)
-        jd_components = self.analyze_job_description(job_description)
+        resume_experience = resume_components.experience.model_dump()
+        jd_experience = jd_components.required_experience.model_dump()
+
+        if fused:
+            scores = self.calculate_fused_scores(resume_components, jd_components)
+            return AnalysisResult(
+                candidate=resume_components,
+                skills=scores.skills,
+                experience=scores.experience,
+                education=scores.education,
+                other=scores.other,
+                recommendations=None,
+                weights=self.weights,
+            )
 
         # Calculate scores
         skills_response = self.calculate_skills_score(
             resume_components.skills, jd_components.required_skills
         )
-        skills_score = skills_response.score * self.weights["skills"]
 
         experience_response = self.calculate_experience_score(
-            resume_components.experience.model_dump(),
-            jd_components.required_experience.model_dump(),
+            resume_experience, jd_experience
         )
-        experience_score = experience_response.score * self.weights["experience"]
 
         education_response = self.calculate_education_score(
             resume_components.education.model_dump(),
             jd_components.required_education.model_dump(),
         )
-        education_score = education_response.score * self.weights["education"]
 
         other_response = self.calculate_other_score(
             resume_components.other_skills.model_dump(),
             jd_components.other_requirements.model_dump(),
         )
-        other_score = other_response.score * self.weights["other"]
-
-        # Calculate total score
-        total_score = skills_score + experience_score + education_score + other_score
 
         # Get recommendations
-        recommendations = self.provide_recommendations(
-            skills_response.model_dump(),
-            resume_components.experience.model_dump(),
-            jd_components.required_experience.model_dump(),
-            job_description,
+        recommendations = None
+        if with_recommendations:
+            recommendations = self.provide_recommendations(
+                skills_response.model_dump(),
+                resume_experience,
+                jd_experience,
+                job_description,
+            )
+
+        return AnalysisResult(
+            candidate=resume_components,
+            skills=skills_response,
+            experience=experience_response,
+            education=education_response,
+            other=other_response,
+            recommendations=recommendations,
+            weights=self.weights,
         )
 
-        return {
-            "name": resume_components.name,
-            "total_score": total_score,
-            "component_scores": {
-                "skills": {"score": skills_score, "reason": skills_response.reason},
-                "experience": {
-                    "score": experience_score,
-                    "reason": experience_response.reason,
-                },
-                "education": {
-                    "score": education_score,
-                    "reason": education_response.reason,
-                },
-                "other": {"score": other_score, "reason": other_response.reason},
-            },
-            "analysis": {
-                "matching_skills": resume_components.skills,
-                "experience_summary": resume_components.experience.model_dump(),
-                "education_summary": resume_components.education.model_dump(),
-                "other_factors": resume_components.other_skills.model_dump(),
-            },
-            "recommendations": recommendations.recommendations,
-        }
+    def analyze_resume(self, resume_text: str, job_description: str) -> AnalysisResult:
+        """
+        Analyzes a single resume against a job description and returns a comprehensive analysis result.
+
+        Args:
+            resume_text: The text content of the resume.
+            job_description: The text content of the job description.
+
+        Returns:
+            An AnalysisResult holding the scores, reasons, analysis summary and recommendations.
+            It can be read like the nested result dictionary. Concurrent calls with
+            the same resume and job description share one analysis.
+        """
+
+        def analyze():
+            # Extract components
+            resume_components = self.extract_resume_components(resume_text)
+            jd_components = self.analyze_job_description(job_description)
+
+            return self.score_candidate(
+                resume_components, jd_components, job_description
+            )
+
+        return self.inflight.do(("analysis", resume_text, job_description), analyze)
 
     def analyze_multiple_resumes(
-        self, resumes: List[str], job_description: str
-    ) -> List[Dict]:
+        self,
+        resumes: List[str],
+        job_description: str,
+        budget: Optional[TokenBudget] = None,
+    ) -> List[AnalysisResult]:
         """
         Analyzes multiple resumes against a job description.
 
         Args:
             resumes: A list of resume texts.
             job_description: The text content of the job description.
+            budget: Optional TokenBudget limiting the tokens spent on the batch and on
+                each candidate. The job description is then extracted once for the
+                batch. When the budget runs low candidates are analyzed in cheaper
+                modes; candidates that no longer fit are listed in `budget.unprocessed`.
 
         Returns:
-            A list of dictionaries, where each dictionary contains the analysis results for a single resume.
+            A list of AnalysisResult objects, one per analyzed resume.
         """
-        for resume in resumes:
-            result = self.analyze_resume(resume, job_description)
+        if budget is not None and resumes:
+            if not budget.can_start(shared_stages=(JD_EXTRACTION,)):
+                budget.unprocessed.extend(range(len(resumes)))
+                return self.results
+            # Extracted once for the batch and charged to it, not to every candidate
+            with budget.shared():
+                jd_components = self.analyze_job_description(job_description)
+
+        for index, resume in enumerate(resumes):
+            if budget is None:
+                result = self.analyze_resume(resume, job_description)
+            elif not budget.can_start():
+                budget.unprocessed.extend(range(index, len(resumes)))
+                break
+            else:
+                result = self._analyze_within_budget(
+                    resume, jd_components, job_description, budget
+                )
+                if result is None:
+                    budget.unprocessed.append(index)
+                    continue
             self.results.append(result)
 
         return self.results
+
+    def _analyze_within_budget(
+        self,
+        resume_text: str,
+        jd_components: JobRequirements,
+        job_description: str,
+        budget: TokenBudget,
+    ) -> Optional[AnalysisResult]:
+        """Analyzes a resume in the mode the budget allows, None if none fits"""
+        with budget.candidate():
+            resume_components = self.extract_resume_components(resume_text)
+
+            mode = budget.plan()
+            if mode == STOP:
+                return None
+            return self.score_candidate(
+                resume_components,
+                jd_components,
+                job_description,
+                with_recommendations=mode == FULL,
+                fused=mode == FUSED_SCORING,
+            )
+
+    def start_batch(
+        self,
+        resumes: List[str],
+        job_description: str,
+        workdir,
+        with_recommendations: bool = True,
+    ):
+        """
+        Starts an offline screening of resumes through the provider's batch interface.
+
+        Args:
+            resumes: A list of resume texts.
+            job_description: The text content of the job description.
+            workdir: Directory for the JSONL request files and the saved batch state.
+            with_recommendations: Whether to run the recommendations round.
+
+        Returns:
+            A BatchScreening; alternate its `write_requests` and `ingest` until `done`,
+            then read `results()`.
+        """
+        from .batch_screening import BatchScreening
+
+        return BatchScreening(
+            self, resumes, job_description, workdir, with_recommendations
+        )
+
+    def analyze_matrix(
+        self,
+        resumes: List[str],
+        job_descriptions: List[str],
+        prefilter: Optional[Callable[[CandidateProfile, JobRequirements], bool]] = None,
+        with_recommendations: bool = False,
+        max_workers: int = 8,
+    ) -> MatchMatrix:
+        """
+        Analyzes every resume against every job description.
+
+        Each resume and each job description is extracted once, so extraction cost grows
+        with N + M. The N x M scoring comparisons then run concurrently, optionally only
+        for the pairs accepted by `prefilter`.
+
+        Args:
+            resumes: A list of resume texts.
+            job_descriptions: A list of job description texts.
+            prefilter: Optional cheap check on the extracted components deciding whether a
+                pair is worth scoring, e.g. `skill_overlap_filter(0.3)`.
+            with_recommendations: Whether to generate recommendations for every scored pair.
+            max_workers: Number of extractions or comparisons running at the same time.
+
+        Returns:
+            A MatchMatrix of AnalysisResult objects, None for pairs skipped by the prefilter.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            candidate_futures = [
+                executor.submit(self.extract_resume_components, resume)
+                for resume in resumes
+            ]
+            job_futures = [
+                executor.submit(self.analyze_job_description, jd)
+                for jd in job_descriptions
+            ]
+            candidates = [future.result() for future in candidate_futures]
+            jobs = [future.result() for future in job_futures]
+
+            pair_futures = {}
+            for i, candidate in enumerate(candidates):
+                for j, job in enumerate(jobs):
+                    if prefilter is not None and not prefilter(candidate, job):
+                        continue
+                    pair_futures[(i, j)] = executor.submit(
+                        self.score_candidate,
+                        candidate,
+                        job,
+                        job_descriptions[j],
+                        with_recommendations,
+                    )
+
+            results = [[None] * len(jobs) for _ in candidates]
+            for (i, j), future in pair_futures.items():
+                results[i][j] = future.result()
+
+        return MatchMatrix(candidates, jobs, results)
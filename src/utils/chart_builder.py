@@ -1,19 +1,19 @@
-from typing import Dict, List
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-
-import plotly.express as px
-import plotly.graph_objects as go
+from typing import TYPE_CHECKING, Dict, List
 
 import streamlit as st
 
+# plotly and pandas are imported inside the chart functions so that importing this
+# module stays cheap until a chart is actually drawn
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 weights = {"skills": 0.4, "experience": 0.3, "education": 0.2, "other": 0.1}
 
 
 @st.cache_data()
-def create_radar_chart(results: List[Dict]) -> go.Figure:
+def create_radar_chart(results: List[Dict]) -> "go.Figure":
     """Create a radar chart to display the candidate scores across categories"""
+    import plotly.graph_objects as go
 
     # Create a copy of the results to avoid modifying the original data
     results_copy = [result.copy() for result in results]
@@ -61,8 +61,10 @@ def create_radar_chart(results: List[Dict]) -> go.Figure:
 
 
 @st.cache_data()
-def create_bar_charts(results: List[Dict]) -> Dict[str, go.Figure]:
+def create_bar_charts(results: List[Dict]) -> Dict[str, "go.Figure"]:
     """Create various bar charts comparing candidates"""
+    import pandas as pd
+    import plotly.graph_objects as go
 
     # Create a copy of the results to avoid modifying the original data
     results_copy = [result.copy() for result in results]
@@ -1,15 +1,113 @@
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from pypdf import PdfReader
+from itertools import islice
+from typing import Iterator, Optional
+
+# Extraction budget per resume. Pages past the budget are never parsed, so oversized
+# uploads cannot dominate a batch's latency, memory or prompt size.
+MAX_PAGES = 10
+MAX_CHARS = 40_000
+MAX_TOKENS = 10_000
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class PdfText:
+    """Text extracted from a PDF within the extraction budget"""
+
+    text: str
+    pages_read: int
+    total_pages: int
+    truncated: bool
+
+
+@contextmanager
+def open_pdf_source(source):
+    """
+    Yields a seekable stream over a PDF without copying it where possible.
+
+    Paths are memory-mapped, bytes are wrapped in a BytesIO (which shares the buffer) and
+    file-like objects such as Streamlit's UploadedFile are used as they are.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            yield mapped
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        yield io.BytesIO(source)
+    else:
+        yield source
+
+
+def iter_pdf_pages(reader) -> Iterator[str]:
+    """Yields the text of each page of a PdfReader, extracting a page only when requested"""
+    for page in reader.pages:
+        yield str(page.extract_text())
+
+
+def extract_pdf_text(
+    source,
+    max_pages: Optional[int] = MAX_PAGES,
+    max_chars: Optional[int] = MAX_CHARS,
+    max_tokens: Optional[int] = MAX_TOKENS,
+) -> PdfText:
+    """
+    Extracts text from a PDF page by page until the page, character or token budget is hit.
+
+    Args:
+        source: A file path, the PDF bytes, or a binary file-like object.
+        max_pages: Maximum number of pages to read. None for no limit.
+        max_chars: Maximum number of characters to keep. None for no limit.
+        max_tokens: Maximum number of tokens to keep, estimated from the character
+            count. None for no limit.
+
+    Returns:
+        A PdfText with the extracted text and whether the budget truncated it.
+    """
+    from pypdf import PdfReader
+
+    char_budget = max_chars
+    if max_tokens is not None:
+        token_chars = max_tokens * CHARS_PER_TOKEN
+        char_budget = (
+            token_chars if char_budget is None else min(char_budget, token_chars)
+        )
+
+    parts = []
+    length = 0
+    pages_read = 0
+    cut_mid_page = False
+    with open_pdf_source(source) as stream:
+        reader = PdfReader(stream)
+        total_pages = len(reader.pages)
+
+        for text in islice(iter_pdf_pages(reader), max_pages):
+            pages_read += 1
+            if char_budget is not None and length + len(text) > char_budget:
+                parts.append(text[: char_budget - length])
+                cut_mid_page = True
+                break
+            parts.append(text)
+            length += len(text)
+            if char_budget is not None and length >= char_budget:
+                break
+
+    return PdfText(
+        text="".join(parts),
+        pages_read=pages_read,
+        total_pages=total_pages,
+        truncated=cut_mid_page or pages_read < total_pages,
+    )
 
 
 def parse_pdf(uploaded_file):
-    """Extract contents from a PDF file"""
-    reader = PdfReader(uploaded_file)
-    text = ""
-    for page in range(len(reader.pages)):
-        page = reader.pages[page]
-        text += str(page.extract_text())
-    return text
+    """Extract contents from a PDF file, within the default extraction budget"""
+    return extract_pdf_text(uploaded_file).text
 
 
 def get_current_date():
@@ -0,0 +1,48 @@
+import re
+from typing import Callable, Tuple
+
+from ..models.candidate import CandidateProfile
+from ..models.job import JobRequirements
+
+# Skill names keep "+" and "#", so "C", "C++" and "C#" stay distinct tokens
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+def _tokens(skill: str) -> Tuple[str, ...]:
+    return tuple(_TOKEN.findall(skill.casefold()))
+
+
+def _contains_tokens(skill: Tuple[str, ...], need: Tuple[str, ...]) -> bool:
+    return any(
+        skill[start : start + len(need)] == need
+        for start in range(len(skill) - len(need) + 1)
+    )
+
+
+def skill_overlap(candidate: CandidateProfile, job: JobRequirements) -> float:
+    """
+    Returns the fraction of the job's required skills found in the candidate's skills.
+
+    Skills are compared case-insensitively by whole words, and a required skill also
+    counts as present when its words appear in a candidate skill (e.g. "AWS" in "AWS
+    Lambda", but not "Go" in "Google Cloud" or "R" in "React").
+    """
+    required = {_tokens(skill) for skill in job.required_skills} - {()}
+    if not required:
+        return 1.0
+    skills = [_tokens(skill) for skill in candidate.skills]
+    found = sum(
+        1 for need in required if any(_contains_tokens(skill, need) for skill in skills)
+    )
+    return found / len(required)
+
+
+def skill_overlap_filter(
+    min_overlap: float,
+) -> Callable[[CandidateProfile, JobRequirements], bool]:
+    """Returns a prefilter accepting pairs with at least `min_overlap` skill overlap"""
+
+    def accept(candidate: CandidateProfile, job: JobRequirements) -> bool:
+        return skill_overlap(candidate, job) >= min_overlap
+
+    return accept
@@ -0,0 +1,407 @@
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Optional, Set
+
+from ..models.scores import EducationScore, ExperienceScore, OtherScore
+
+# Degree levels, checked from the highest down
+DEGREE_LEVELS = (
+    (5, "Doctorate", r"\b(ph\.?\s?d|doctorate|doctoral|d\.?phil)(?!\w)"),
+    (
+        4,
+        "Master's",
+        r"\b(master'?s?|m\.?\s?s\.?c?|m\.?\s?tech|m\.?\s?e\.|mba|m\.?\s?a\.?|mca|post-?graduate)(?!\w)",
+    ),
+    (
+        3,
+        "Bachelor's",
+        r"\b(bachelor'?s?|b\.?\s?s\.?c?|b\.?\s?tech|b\.?\s?e\.|b\.?\s?a\.?|bca|undergraduate|graduate degree)(?!\w)",
+    ),
+    (2, "Associate", r"\b(associate'?s?|(?<!school )diploma)(?!\w)"),
+    (1, "High school", r"\b(high school|secondary school|ged)(?!\w)"),
+)
+
+# A duration; a range in a single unit ("2-4 years", "2 to 4 years") is absorbed
+_YEARS = re.compile(
+    r"(\d+(?:\.\d+)?)\s*(?:\+|plus)?\s*(?:(?:[-–—]|to)\s*\d+(?:\.\d+)?\s*)?"
+    r"(years?|yrs?|months?|mos?)\b"
+)
+# A range separator next to a number, left over once the durations are taken out
+_RANGE = re.compile(r"\d\s*(?:[-–—]|to\b)|(?:[-–—]|\bto)\s*\d")
+# What may separate the years and months of one duration ("1 year, 6 months")
+_UNIT_GAP = re.compile(r"\s*(?:,|and)?\s*")
+# Wording making an education requirement negotiable, e.g. "or equivalent experience"
+_SOFT_REQUIREMENT = re.compile(
+    r"\b(equivalent|preferred|plus|desirable|ideally|advantage|nice to have)\b"
+)
+_WORD = re.compile(r"[a-z0-9+#]+")
+# Remote work ruled out, e.g. "no remote work", "not remote", "non-remote"
+_NO_REMOTE = re.compile(r"\b(no|not|non)\b[\s-]*(fully\s+)?remote\b")
+# Words describing a work arrangement rather than a place
+_LOCATION_MODES = {
+    "anywhere",
+    "based",
+    "flexible",
+    "from",
+    "fully",
+    "hybrid",
+    "office",
+    "on",
+    "onsite",
+    "remote",
+    "site",
+    "work",
+}
+# Words describing proficiency rather than the language itself
+_PROFICIENCY = {
+    "advanced",
+    "basic",
+    "business",
+    "conversational",
+    "excellent",
+    "fluency",
+    "fluent",
+    "level",
+    "native",
+    "professional",
+    "proficiency",
+    "proficient",
+    "spoken",
+    "strong",
+    "working",
+    "written",
+}
+# Words ignored when comparing roles, fields of study and places
+_FILLER = {
+    "a",
+    "an",
+    "and",
+    "any",
+    "degree",
+    "equivalent",
+    "field",
+    "fields",
+    "in",
+    "of",
+    "or",
+    "related",
+    "similar",
+    "the",
+    "with",
+}
+
+
+def _words(text: str) -> Set[str]:
+    return set(_WORD.findall(text.casefold())) - _FILLER
+
+
+def parse_years(text: str) -> Optional[float]:
+    """
+    Parses a duration such as "3 years", "2.5 yrs", "3+ years", "1 year 6 months" or
+    "2-4 years" (the lower bound) into years. Returns None when no duration is found
+    or the text holds anything else, such as a range across units ("6 months - 2
+    years") or several unrelated durations.
+    """
+    lowered = text.casefold()
+    matches = list(_YEARS.finditer(lowered))
+    if not matches or _RANGE.search(_YEARS.sub(" 0 ", lowered)):
+        return None
+    if len(matches) == 2:
+        years, months = matches
+        gap = lowered[years.end() : months.start()]
+        if (
+            years.group(2).startswith("mo")
+            or not months.group(2).startswith("mo")
+            or not _UNIT_GAP.fullmatch(gap)
+        ):
+            return None
+    elif len(matches) > 2:
+        return None
+    return sum(
+        float(match.group(1)) / (12 if match.group(2).startswith("mo") else 1)
+        for match in matches
+    )
+
+
+def degree_level(text: str, lowest: bool = False) -> Optional[int]:
+    """
+    Returns the level of a degree in DEGREE_LEVELS, None if it is not recognized.
+
+    A text naming several degrees gives the highest level, or with `lowest` the lowest
+    one, as a requirement such as "Master's or PhD" is met by either.
+    """
+    lowered = text.casefold()
+    levels = [
+        level for level, _, pattern in DEGREE_LEVELS if re.search(pattern, lowered)
+    ]
+    if not levels:
+        return None
+    return min(levels) if lowest else max(levels)
+
+
+def _field_words(degree: str) -> Set[str]:
+    """Words of a degree naming its field of study, degree words removed"""
+    lowered = degree.casefold()
+    for _, _, pattern in DEGREE_LEVELS:
+        lowered = re.sub(pattern, " ", lowered)
+    return _words(lowered) - {"master", "bachelor", "science", "arts"}
+
+
+def _contains(haystack: Iterable[str], needle: str) -> bool:
+    """
+    Whether an item of `haystack` contains the words of `needle` in sequence, e.g. the
+    requirement "communication" in "strong communication skills". Only whole words
+    count, and only in that direction: "AWS" does not cover "AWS Certified Solutions
+    Architect", nor "AI" the domain "Retail".
+    """
+    needle = tuple(_WORD.findall(needle.casefold()))
+    if not needle:
+        return False
+    for item in haystack:
+        words = tuple(_WORD.findall(item.casefold()))
+        if any(
+            words[start : start + len(needle)] == needle
+            for start in range(len(words) - len(needle) + 1)
+        ):
+            return True
+    return False
+
+
+def score_experience(resume_exp: Dict, required_exp: Dict) -> Optional[ExperienceScore]:
+    """
+    Scores experience locally when the years make the outcome clear.
+
+    Candidate roles matching a required role by name count towards it. The candidate
+    clearly meets the requirement when the matching roles cover the required years and
+    share a required domain (if any); clearly misses it when all their experience
+    together is under half the requirement. Anything else, including durations that
+    cannot be parsed, is left to the LLM.
+
+    Returns:
+        An ExperienceScore, or None when the comparison is ambiguous.
+    """
+    required_roles = required_exp.get("years_per_role", [])
+    candidate_roles = resume_exp.get("years_per_role", [])
+    if not required_roles:
+        return None
+
+    candidate_years = [(role, parse_years(role["years"])) for role in candidate_roles]
+    if any(years is None for _, years in candidate_years):
+        return None
+    total = sum(years for _, years in candidate_years)
+
+    surplus = []
+    for requirement in required_roles:
+        needed = parse_years(requirement["years"])
+        if needed is None:
+            return None
+        role_words = _words(requirement["role"])
+        relevant = sum(
+            years
+            for role, years in candidate_years
+            if role_words and role_words <= _words(role["role"])
+        )
+        if total < needed / 2:
+            return ExperienceScore(
+                score=round(50 * total / needed),
+                reason=f"The candidate has {total:g} years of experience in total, "
+                f"well below the {needed:g} years required for {requirement['role']}.",
+            )
+        if relevant < needed:
+            return None
+        surplus.append(relevant - needed)
+
+    required_domains = required_exp.get("domains", [])
+    domains = resume_exp.get("domains", [])
+    if required_domains and not any(_contains(domains, d) for d in required_domains):
+        return None
+
+    extra = min(surplus)
+    unit = "year" if extra == 1 else "years"
+    return ExperienceScore(
+        score=min(100, 85 + round(5 * extra)),
+        reason="The candidate's experience in matching roles meets the required years"
+        + (f", with {extra:g} {unit} to spare" if extra else "")
+        + (" in a required domain." if required_domains else "."),
+    )
+
+
+def score_education(resume_edu: Dict, required_edu: Dict) -> Optional[EducationScore]:
+    """
+    Scores education locally by degree level, field of study and certifications.
+
+    The candidate clearly meets the requirement when their highest degree reaches the
+    required level in a field named by the requirement (if any) and they hold every
+    required certification; clearly misses it when they are two or more levels short.
+    A requirement naming alternatives counts at its lowest level. Unrecognized degrees,
+    other fields, missing certifications, one-level gaps, candidates listing no degree
+    and negotiable requirements ("or equivalent", "preferred", "a plus") are left to
+    the LLM.
+
+    Returns:
+        An EducationScore, or None when the comparison is ambiguous.
+    """
+    required_degrees = required_edu.get("degrees", [])
+    required_certs = required_edu.get("certifications", [])
+    degrees = resume_edu.get("degrees", [])
+    certifications = resume_edu.get("certifications", [])
+
+    if not required_degrees and not required_certs:
+        return EducationScore(
+            score=100,
+            reason="The job states no education or certification requirement.",
+        )
+
+    if any(
+        _SOFT_REQUIREMENT.search(requirement.casefold())
+        for requirement in required_degrees + required_certs
+    ):
+        return None
+    if required_degrees and not degrees:
+        return None
+
+    required_levels = [degree_level(degree, lowest=True) for degree in required_degrees]
+    candidate_levels = [degree_level(degree) for degree in degrees]
+    if None in required_levels or None in candidate_levels:
+        return None
+    required_level = min(required_levels, default=0)
+    candidate_level = max(candidate_levels, default=0)
+
+    if required_level - candidate_level >= 2:
+        return EducationScore(
+            score=20,
+            reason="The candidate's highest education is well below the required "
+            f"{_level_name(required_level)} degree.",
+        )
+    if candidate_level < required_level:
+        return None
+
+    fields = set().union(*(_field_words(degree) for degree in required_degrees))
+    if fields:
+        qualifying = [
+            degree
+            for degree, level in zip(degrees, candidate_levels)
+            if level >= required_level
+        ]
+        if not any(_field_words(degree) & fields for degree in qualifying):
+            return None
+
+    if not all(_contains(certifications, cert) for cert in required_certs):
+        return None
+
+    exceeds = candidate_level > required_level
+    return EducationScore(
+        score=95 if exceeds else 90,
+        reason=f"The candidate holds a {_level_name(candidate_level)} degree"
+        + (" in a required field" if fields else "")
+        + (
+            f", above the required {_level_name(required_level)} level"
+            if exceeds
+            else ", meeting the required level"
+        )
+        + (" and every required certification." if required_certs else "."),
+    )
+
+
+def _level_name(level: int) -> str:
+    return {lvl: name for lvl, name, _ in DEGREE_LEVELS}.get(level, "no")
+
+
+def score_other(resume_other: Dict, required_other: Dict) -> Optional[OtherScore]:
+    """
+    Scores location, languages and soft skills locally.
+
+    Location matches when the job is remote with no place attached, or when the
+    candidate's location names every place word of the job's location (both "new" and
+    "york" for New York). Every required language has to be listed by the candidate.
+    Soft skills then set the score by the share of required ones the candidate lists.
+    Other locations, remote jobs restricted to a place ("Remote (US only)") or ruling
+    remote out ("No remote work"), hybrid or on-site jobs naming no place, missing
+    languages and candidates matching none of the required soft skills are left to the
+    LLM.
+
+    Returns:
+        An OtherScore, or None when the comparison is ambiguous.
+    """
+    location = required_other.get("location", "")
+    required_location = _words(location)
+    places = required_location - _LOCATION_MODES
+    if required_location & {"remote", "anywhere"}:
+        # Remote with a restriction or negation needs reading in context
+        if places or _NO_REMOTE.search(location.casefold()):
+            return None
+    elif required_location:
+        # Hybrid or on-site jobs naming no place cannot be checked locally
+        if not places or not places <= _words(resume_other.get("location", "")):
+            return None
+
+    spoken = set().union(
+        *(_words(language) for language in resume_other.get("languages", []))
+    )
+    for language in required_other.get("languages", []):
+        names = _words(language) - _PROFICIENCY
+        if names and not names & spoken:
+            return None
+
+    required_soft = required_other.get("soft_skills", [])
+    soft = resume_other.get("soft_skills", [])
+    matched = [skill for skill in required_soft if _contains(soft, skill)]
+    if required_soft and not matched:
+        return None
+    share = len(matched) / len(required_soft) if required_soft else 1.0
+
+    return OtherScore(
+        score=70 + round(30 * share),
+        reason="Location and language requirements are met"
+        + (
+            f"; the candidate lists {len(matched)} of {len(required_soft)} required "
+            "soft skills."
+            if required_soft
+            else "."
+        ),
+    )
+
+
+class RuleScorer:
+    """
+    Deterministic scorers for the experience, education and other sections, with
+    counters of how often each section was scored locally or deferred to the LLM.
+    """
+
+    SCORERS = {
+        "experience": score_experience,
+        "education": score_education,
+        "other": score_other,
+    }
+
+    def __init__(self):
+        self.counts = Counter()
+        self._lock = threading.Lock()
+
+    def score(self, section: str, resume_part: Dict, required_part: Dict):
+        """
+        Args:
+            section: "experience", "education" or "other".
+            resume_part: The section as extracted from the resume.
+            required_part: The section as extracted from the job description.
+
+        Returns:
+            The section's score model, or None when the LLM should score it.
+        """
+        result = self.SCORERS[section](resume_part, required_part)
+        with self._lock:
+            self.counts[(section, "rule" if result is not None else "deferred")] += 1
+        return result
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Returns per section how many scores were computed locally and deferred"""
+        with self._lock:
+            counts = dict(self.counts)
+        return {
+            section: {
+                "rule": counts.get((section, "rule"), 0),
+                "deferred": counts.get((section, "deferred"), 0),
+            }
+            for section in self.SCORERS
+        }
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+from .singleflight import SingleFlight
+
+
+def canonicalize(value: Any) -> Any:
+    """
+    Normalizes a JSON-compatible value so that equivalent inputs compare equal.
+
+    Strings are whitespace-collapsed and case-folded, dictionaries are canonicalized
+    per value and lists are canonicalized per item and sorted. Tuples hold positional
+    parts (e.g. the candidate and job description sides) and keep their order.
+    """
+    if isinstance(value, str):
+        return " ".join(value.split()).casefold()
+    if isinstance(value, dict):
+        return {str(key): canonicalize(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [canonicalize(item) for item in value]
+    if isinstance(value, (list, set)):
+        items = [canonicalize(item) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+    return value
+
+
+def canonical_key(*parts: Any) -> str:
+    """Returns a stable hash of the canonical JSON of the given parts"""
+    payload = json.dumps(
+        [canonicalize(part) for part in parts],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache with hit/miss counters"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class StageCache:
+    """
+    One LRU cache per pipeline stage, keyed by the canonical JSON of the stage inputs.
+
+    Concurrent misses for the same inputs are coalesced, so the result is computed once
+    even when identical requests arrive before the first one has filled the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Args:
+            maxsize: Maximum number of entries kept per stage. 0 disables caching.
+        """
+        self.maxsize = maxsize
+        self._caches: Dict[str, LRUCache] = {}
+        self._inflight = SingleFlight()
+        self._lock = threading.Lock()
+
+    def for_stage(self, stage: str) -> LRUCache:
+        with self._lock:
+            if stage not in self._caches:
+                self._caches[stage] = LRUCache(self.maxsize)
+            return self._caches[stage]
+
+    def get_or_compute(self, stage: str, inputs: Any, compute: Callable[[], Any]):
+        """
+        Returns the cached result for `inputs` of `stage`, computing and storing it on a miss.
+
+        Args:
+            stage: The pipeline stage name.
+            inputs: The stage inputs as a (candidate side, job description side) tuple.
+            compute: Callable producing the result on a cache miss.
+        """
+        if self.maxsize <= 0:
+            return compute()
+
+        cache = self.for_stage(stage)
+        key = canonical_key(inputs)
+        result = cache.get(key)
+        if result is None:
+            result = self._inflight.do(
+                (stage, key), lambda: self._fill(cache, key, compute)
+            )
+        return result
+
+    @staticmethod
+    def _fill(cache: LRUCache, key: str, compute: Callable[[], Any]):
+        result = compute()
+        cache.put(key, result)
+        return result
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Returns hits, misses and size for every stage"""
+        with self._lock:
+            caches = dict(self._caches)
+        return {
+            stage: {"hits": cache.hits, "misses": cache.misses, "size": len(cache)}
+            for stage, cache in caches.items()
+        }
@@ -0,0 +1,22 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.prefilter import skill_overlap
+
+
+@pytest.mark.parametrize(
+    "skills, required, expected",
+    [
+        (["AWS Lambda"], ["AWS"], 1.0),
+        (["Node.js"], ["node.js"], 1.0),
+        (["Google Cloud"], ["Go"], 0.0),
+        (["React"], ["R"], 0.0),
+        (["C++"], ["C"], 0.0),
+        (["Python"], [], 1.0),
+    ],
+)
+def test_skill_overlap(skills, required, expected):
+    candidate = SimpleNamespace(skills=skills)
+    job = SimpleNamespace(required_skills=required)
+    assert skill_overlap(candidate, job) == expected
@@ -0,0 +1,148 @@
+import pytest
+
+from src.utils.rule_scorer import (
+    parse_years,
+    score_education,
+    score_experience,
+    score_other,
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("3 years", 3.0),
+        ("2.5 yrs", 2.5),
+        ("3+ years", 3.0),
+        ("18 months", 1.5),
+        ("1 year 6 months", 1.5),
+        ("1 year, 6 months", 1.5),
+        ("2-4 years", 2.0),
+        ("2 to 4 years", 2.0),
+        ("6 months - 2 years", None),
+        ("6 months to 2 years", None),
+        ("2 years 3 years", None),
+        ("Jan 2020 - Mar 2022 (2 years)", None),
+        ("several years", None),
+    ],
+)
+def test_parse_years(text, expected):
+    assert parse_years(text) == expected
+
+
+@pytest.mark.parametrize(
+    "candidate_years, required_years, expected",
+    [
+        ("6 years", "3 years", 100),
+        ("1 year", "5 years", 10),
+        ("6 months - 2 years", "2 years", None),
+    ],
+)
+def test_score_experience(candidate_years, required_years, expected):
+    resume = {"years_per_role": [{"role": "Data Engineer", "years": candidate_years}]}
+    required = {"years_per_role": [{"role": "Data Engineer", "years": required_years}]}
+    result = score_experience(resume, required)
+    assert (result and result.score) == expected
+
+
+@pytest.mark.parametrize(
+    "required_location, location, expected",
+    [
+        ("Remote", "Paris, France", 100),
+        ("Fully remote", "Paris, France", 100),
+        ("Remote (US only)", "Paris, France", None),
+        ("Remote within the EU", "Paris, France", None),
+        ("No remote work, on-site in Berlin", "Pune, India", None),
+        ("Non-remote", "Pune, India", None),
+        ("", "Paris, France", 100),
+        ("On-site, New York", "New York, NY", 100),
+        ("On-site, New York", "York, UK", None),
+        ("Hybrid", "Paris, France", None),
+        ("On-site", "Paris, France", None),
+    ],
+)
+def test_score_other_location(required_location, location, expected):
+    resume = {"location": location, "languages": [], "soft_skills": []}
+    required = {"location": required_location, "languages": [], "soft_skills": []}
+    result = score_other(resume, required)
+    assert (result and result.score) == expected
+
+
+@pytest.mark.parametrize(
+    "soft_skills, required_soft, expected",
+    [
+        (["Strong communication skills", "Teamwork"], ["Communication"], 100),
+        (["Teamwork"], ["Communication", "Teamwork"], 85),
+        (["Leadership"], ["Communication", "Teamwork"], None),
+        ([], ["Communication"], None),
+    ],
+)
+def test_score_other_soft_skills(soft_skills, required_soft, expected):
+    resume = {"location": "", "languages": [], "soft_skills": soft_skills}
+    required = {"location": "", "languages": [], "soft_skills": required_soft}
+    result = score_other(resume, required)
+    assert (result and result.score) == expected
+
+
+@pytest.mark.parametrize(
+    "required, degrees, expected",
+    [
+        ("Bachelor's in Computer Science", ["M.S. in Computer Science"], 95),
+        ("Bachelor's in Computer Science", ["B.Tech in Computer Science"], 90),
+        ("PhD in Physics", ["High School Diploma"], 20),
+        ("Master's or PhD in Computer Science", ["B.Tech in Computer Science"], None),
+        ("Master's or PhD in Computer Science", ["PhD in Computer Science"], 95),
+        (
+            "Bachelor's degree in Computer Science (Master's preferred)",
+            ["Associate degree in IT"],
+            None,
+        ),
+        ("Bachelor's degree in Computer Science or equivalent experience", [], None),
+        ("Bachelor's degree in Computer Science", [], None),
+    ],
+)
+def test_score_education_degrees(required, degrees, expected):
+    resume = {"degrees": degrees, "certifications": []}
+    result = score_education(resume, {"degrees": [required], "certifications": []})
+    assert (result and result.score) == expected
+
+
+@pytest.mark.parametrize(
+    "required, certifications, expected",
+    [
+        (
+            "AWS Certified Solutions Architect",
+            ["AWS Certified Solutions Architect - Associate"],
+            90,
+        ),
+        ("AWS Certified Solutions Architect - Professional", ["AWS"], None),
+        ("PMP", ["PMP-adjacent coursework"], 90),
+        ("CISSP", ["CISSP-like training"], 90),
+        ("Scrum", ["Scrumban"], None),
+    ],
+)
+def test_score_education_certifications(required, certifications, expected):
+    resume = {"degrees": [], "certifications": certifications}
+    result = score_education(resume, {"degrees": [], "certifications": [required]})
+    assert (result and result.score) == expected
+
+
+@pytest.mark.parametrize(
+    "domains, required_domains, expected",
+    [
+        (["Retail banking"], ["Retail"], 100),
+        (["AI"], ["Retail"], None),
+        (["Fintech"], ["Fin"], None),
+    ],
+)
+def test_score_experience_domains(domains, required_domains, expected):
+    resume = {
+        "years_per_role": [{"role": "Data Engineer", "years": "6 years"}],
+        "domains": domains,
+    }
+    required = {
+        "years_per_role": [{"role": "Data Engineer", "years": "3 years"}],
+        "domains": required_domains,
+    }
+    result = score_experience(resume, required)
+    assert (result and result.score) == expected